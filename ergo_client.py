@@ -30,6 +30,8 @@ class ErgoClient:
         self.explorer_api_url = explorer_api_url
         self.node_api_url = node_api_url
         self.timeout = timeout
+        # Created on first request and reused, so connections are kept alive between calls
+        self._client: Optional[httpx.AsyncClient] = None
         
         # Configure logging based on environment variables
         self.log_full_responses = os.environ.get('LOG_FULL_RESPONSES', 'true').lower() == 'true'
@@ -41,6 +43,18 @@ class ErgoClient:
         logger.info(f"Logging configuration: Full responses: {self.log_full_responses}, "
                    f"Max length: {self.max_log_length}, Pretty print: {self.pretty_print}")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the client's HTTP connection pool, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections held by this client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _format_response_for_log(self, data):
         """Format response data for logging with truncation and pretty printing."""
         if not data:
@@ -91,38 +105,39 @@ class ErgoClient:
         logger.debug(f"Making {method} request to {log_url}")
             
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, params=params, headers=default_headers)
-                elif method.upper() == "POST":
-                    response = await client.post(url, params=params, json=json_data, headers=default_headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                logger.debug(f"Received response: status={response.status_code}, content-type={response.headers.get('content-type', 'unknown')}")
-                
-                response.raise_for_status()
-                response_data = response.json()
-                
-                if self.log_full_responses:
-                    logger.info(f"Response from {method} {url.split('/')[-1]}:\n"
-                               f"{self._format_response_for_log(response_data)}")
+            client = self._get_client()
+            if method.upper() == "GET":
+                response = await client.get(url, params=params, headers=default_headers)
+            elif method.upper() == "POST":
+                response = await client.post(url, params=params, json=json_data, headers=default_headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            logger.debug(f"Received response: status={response.status_code}, content-type={response.headers.get('content-type', 'unknown')}")
+            
+            response.raise_for_status()
+            response_data = response.json()
+            
+            if self.log_full_responses:
+                logger.info(f"Response from {method} {url.split('/')[-1]}:\n"
+                           f"{self._format_response_for_log(response_data)}")
+            else:
+                # Log just a summary of the response
+                if isinstance(response_data, dict):
+                    keys = list(response_data.keys())
+                    logger.info(f"Response keys: {keys}")
+                elif isinstance(response_data, list):
+                    logger.info(f"Response is a list with {len(response_data)} items")
                 else:
-                    # Log just a summary of the response
-                    if isinstance(response_data, dict):
-                        keys = list(response_data.keys())
-                        logger.info(f"Response keys: {keys}")
-                    elif isinstance(response_data, list):
-                        logger.info(f"Response is a list with {len(response_data)} items")
-                    else:
-                        logger.info(f"Response type: {type(response_data)}")
-                
-                return response_data
+                    logger.info(f"Response type: {type(response_data)}")
+            
+            return response_data
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e}")
             # Log the error response content if available
-            if hasattr(e, 'response') and hasattr(e.response, 'text'):
-                logger.error(f"Error response: {e.response.text[:500]}")
+            response_text = getattr(getattr(e, 'response', None), 'text', None)
+            if response_text is not None:
+                logger.error(f"Error response: {response_text[:500]}")
             raise
         except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
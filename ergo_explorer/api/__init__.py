@@ -2,19 +2,19 @@
 API client for interacting with the Ergo Explorer API.
 """
 
-import httpx
 from typing import Dict, Optional
 
 from ergo_explorer.config import ERGO_EXPLORER_API, USER_AGENT
+from ergo_explorer.http_session import get_client
 
 async def fetch_api(endpoint: str, params: Optional[Dict] = None) -> Dict:
     """Make a request to the Ergo Explorer API."""
     url = f"{ERGO_EXPLORER_API}/{endpoint}"
-    async with httpx.AsyncClient() as client:
-        headers = {"User-Agent": USER_AGENT}
-        response = await client.get(url, headers=headers, params=params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    client = get_client()
+    headers = {"User-Agent": USER_AGENT}
+    response = await client.get(url, headers=headers, params=params, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 async def fetch_balance(address: str) -> Dict:
     """Fetch the confirmed balance for an address."""
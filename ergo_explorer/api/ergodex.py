@@ -1,10 +1,10 @@
 """
 API client for interacting with ErgoDEX for token prices and liquidity information.
 """
-import httpx
 from typing import Dict, List, Optional, Union, Any
 import asyncio
 from datetime import datetime, timedelta
+from ergo_explorer.http_session import get_client
 
 # ErgoDEX API endpoints
 ERGODEX_API_URL = "https://api.ergodex.io/v1"
@@ -13,18 +13,18 @@ SPECTRUM_API_URL = "https://api.spectrum.fi/v1"
 async def fetch_ergodex_api(endpoint: str, params: Optional[Dict] = None) -> Dict:
     """Make a request to the ErgoDEX API."""
     url = f"{ERGODEX_API_URL}/{endpoint}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    client = get_client()
+    response = await client.get(url, params=params, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 async def fetch_spectrum_api(endpoint: str, params: Optional[Dict] = None) -> Dict:
     """Make a request to the Spectrum Finance API."""
     url = f"{SPECTRUM_API_URL}/{endpoint}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    client = get_client()
+    response = await client.get(url, params=params, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 async def get_token_price(token_id: str) -> Dict[str, Any]:
     """Get the current price of a token in ERG.
@@ -83,14 +83,14 @@ async def get_erg_price_usd() -> float:
         return float(response.get("price", 0))
     except Exception:
         # Fallback to another source like CoinGecko
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": "ergo", "vs_currencies": "usd"},
-                timeout=30.0
-            )
-            data = response.json()
-            return float(data.get("ergo", {}).get("usd", 0))
+        client = get_client()
+        response = await client.get(
+            "https://api.coingecko.com/api/v3/simple/price",
+            params={"ids": "ergo", "vs_currencies": "usd"},
+            timeout=30.0
+        )
+        data = response.json()
+        return float(data.get("ergo", {}).get("usd", 0))
 
 async def get_liquidity_pools(token_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get liquidity pools information, optionally filtered by token.
@@ -1,15 +1,15 @@
 """ErgoWatch API client for Ergo blockchain analytics."""
-import httpx
 from typing import Dict, List, Optional, Union
 from ..config import ERGOWATCH_API_URL
+from ..http_session import get_client
 
 async def fetch_api(endpoint: str, params: Optional[Dict] = None) -> Dict:
     """Make a request to the ErgoWatch API."""
     url = f"{ERGOWATCH_API_URL}/{endpoint}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    client = get_client()
+    response = await client.get(url, params=params, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 # Address Analytics
 async def get_address_balance(address: str, token_id: Optional[str] = None) -> Dict:
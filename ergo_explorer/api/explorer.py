@@ -4,6 +4,7 @@ Ergo Explorer API client.
 import httpx
 from typing import Dict, List, Any, Optional
 from ergo_explorer.config import ERGO_EXPLORER_API, USER_AGENT
+from ergo_explorer.http_session import get_client
 import logging
 import os
 import json
@@ -14,28 +15,28 @@ async def fetch_api(endpoint: str, params: Optional[Dict] = None) -> Dict:
         url = f"{ERGO_EXPLORER_API}/{endpoint}"
         logging.info(f"Making API request to: {url}")
         
-        async with httpx.AsyncClient() as client:
-            headers = {"User-Agent": USER_AGENT}
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            
-            # Log response status
-            logging.info(f"API response status: {response.status_code}")
-            
-            # Check for error status codes
-            response.raise_for_status()
+        client = get_client()
+        headers = {"User-Agent": USER_AGENT}
+        response = await client.get(url, headers=headers, params=params, timeout=30.0)
+        
+        # Log response status
+        logging.info(f"API response status: {response.status_code}")
+        
+        # Check for error status codes
+        response.raise_for_status()
+        
+        # Try to parse JSON response
+        try:
+            data = response.json()
+            if isinstance(data, dict):
+                return data
+            else:
+                logging.error(f"Unexpected response format: {data}")
+                return {"items": [], "error": "Invalid response format"}
+        except ValueError as e:
+            logging.error(f"Failed to parse JSON response: {str(e)}")
+            return {"items": [], "error": "Invalid JSON response"}
             
-            # Try to parse JSON response
-            try:
-                data = response.json()
-                if isinstance(data, dict):
-                    return data
-                else:
-                    logging.error(f"Unexpected response format: {data}")
-                    return {"items": [], "error": "Invalid response format"}
-            except ValueError as e:
-                logging.error(f"Failed to parse JSON response: {str(e)}")
-                return {"items": [], "error": "Invalid JSON response"}
-                
     except httpx.HTTPStatusError as e:
         logging.error(f"HTTP error occurred: {str(e)}")
         return {"items": [], "error": f"HTTP error: {e.response.status_code}"}
@@ -58,61 +59,61 @@ async def fetch_address_transactions(address: str, limit: int = 20, offset: int
         
         params = {"limit": limit, "offset": offset}
         
-        async with httpx.AsyncClient() as client:
-            headers = {"User-Agent": USER_AGENT}
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            
-            # Log request details
-            logging.info(f"HTTP Request: {response.request.method} {response.request.url}")
-            logging.info(f"HTTP Response: {response.status_code}")
-            
-            # Check for error status codes
-            if response.status_code != 200:
-                logging.error(f"HTTP error received: {response.status_code} for address {address}")
+        client = get_client()
+        headers = {"User-Agent": USER_AGENT}
+        response = await client.get(url, headers=headers, params=params, timeout=30.0)
+        
+        # Log request details
+        logging.info(f"HTTP Request: {response.request.method} {response.request.url}")
+        logging.info(f"HTTP Response: {response.status_code}")
+        
+        # Check for error status codes
+        if response.status_code != 200:
+            logging.error(f"HTTP error received: {response.status_code} for address {address}")
+            return {
+                "items": [],
+                "total": 0,
+                "error": f"HTTP error: {response.status_code}",
+                "address": address
+            }
+        
+        # Try to parse JSON response
+        try:
+            data = response.json()
+            # Validate the response structure
+            if not isinstance(data, dict):
+                logging.error(f"Invalid response format: expected dict, got {type(data)}")
                 return {
                     "items": [],
                     "total": 0,
-                    "error": f"HTTP error: {response.status_code}",
+                    "error": "Invalid response format",
                     "address": address
                 }
             
-            # Try to parse JSON response
-            try:
-                data = response.json()
-                # Validate the response structure
-                if not isinstance(data, dict):
-                    logging.error(f"Invalid response format: expected dict, got {type(data)}")
-                    return {
-                        "items": [],
-                        "total": 0,
-                        "error": "Invalid response format",
-                        "address": address
-                    }
-                
-                # Ensure the expected structure exists
-                if "items" not in data:
-                    logging.warning(f"No 'items' field in response for address {address}. Keys: {list(data.keys())}")
-                    data["items"] = []
-                
-                if "total" not in data:
-                    data["total"] = len(data.get("items", []))
-                    
-                # Log some information about the results    
-                logging.info(f"Retrieved {len(data.get('items', []))} transactions for address {address} (total: {data.get('total', 0)})")
-                
-                # Add the address to the response for reference
-                data["address"] = address
-                
-                return data
-            except ValueError as e:
-                logging.error(f"Failed to parse JSON response from address transactions: {str(e)}")
-                return {
-                    "items": [],
-                    "total": 0,
-                    "error": "Invalid JSON response",
-                    "address": address
-                }
+            # Ensure the expected structure exists
+            if "items" not in data:
+                logging.warning(f"No 'items' field in response for address {address}. Keys: {list(data.keys())}")
+                data["items"] = []
+            
+            if "total" not in data:
+                data["total"] = len(data.get("items", []))
                 
+            # Log some information about the results    
+            logging.info(f"Retrieved {len(data.get('items', []))} transactions for address {address} (total: {data.get('total', 0)})")
+            
+            # Add the address to the response for reference
+            data["address"] = address
+            
+            return data
+        except ValueError as e:
+            logging.error(f"Failed to parse JSON response from address transactions: {str(e)}")
+            return {
+                "items": [],
+                "total": 0,
+                "error": "Invalid JSON response",
+                "address": address
+            }
+            
     except httpx.HTTPStatusError as e:
         logging.error(f"HTTP error occurred in fetch_address_transactions: {str(e)}")
         return {
@@ -254,27 +255,27 @@ async def fetch_address_book() -> Dict:
         
         logging.info(f"Fetching address book data from: {url}")
         
-        async with httpx.AsyncClient() as client:
-            headers = {"User-Agent": USER_AGENT}
-            # Add longer timeout and more retries for external API
-            response = await client.get(url, headers=headers, timeout=60.0)
-            
-            # Log response status
-            logging.info(f"Address book API response status: {response.status_code}")
-            
-            # Check for error status codes
-            response.raise_for_status()
+        client = get_client()
+        headers = {"User-Agent": USER_AGENT}
+        # Add longer timeout and more retries for external API
+        response = await client.get(url, headers=headers, timeout=60.0)
+        
+        # Log response status
+        logging.info(f"Address book API response status: {response.status_code}")
+        
+        # Check for error status codes
+        response.raise_for_status()
+        
+        # Try to parse JSON response
+        try:
+            data = response.json()
+            # Log success
+            logging.info(f"Successfully fetched address book data: {len(data.get('items', []))} items found")
+            return data
+        except ValueError as e:
+            logging.error(f"Failed to parse address book JSON response: {str(e)}")
+            return _load_fallback_address_book()
             
-            # Try to parse JSON response
-            try:
-                data = response.json()
-                # Log success
-                logging.info(f"Successfully fetched address book data: {len(data.get('items', []))} items found")
-                return data
-            except ValueError as e:
-                logging.error(f"Failed to parse address book JSON response: {str(e)}")
-                return _load_fallback_address_book()
-                
     except httpx.HTTPStatusError as e:
         logging.error(f"HTTP error occurred in address book request: {str(e)}")
         return _load_fallback_address_book()
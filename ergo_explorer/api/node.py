@@ -5,6 +5,7 @@ import httpx
 import logging
 from typing import Dict, List, Any, Optional, Union
 from ergo_explorer.config import ERGO_NODE_API, ERGO_NODE_API_KEY, USER_AGENT
+from ergo_explorer.http_session import get_client
 from ergo_explorer.logging_config import get_logger
 
 # Configure logger - Ensure DEBUG level to capture detailed logs
@@ -13,54 +14,54 @@ logger = get_logger(__name__, log_level='DEBUG')
 async def fetch_node_api(endpoint: str, params: Optional[Dict] = None, method: str = "GET", json_data: Optional[Dict] = None) -> Dict:
     """Make a request to the Ergo Node API."""
     url = f"{ERGO_NODE_API}/{endpoint}"
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Content-Type": "application/json"
-        }
-        
-        # Add API key if available
-        if ERGO_NODE_API_KEY:
-            headers["api_key"] = ERGO_NODE_API_KEY
-            
-        # Log request details before sending
-        logger.debug(f"Node API Request: Method={method}, URL={url}, Params={params}, JSON={json_data}, Headers={headers}")
+    client = get_client()
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Content-Type": "application/json"
+    }
+    
+    # Add API key if available
+    if ERGO_NODE_API_KEY:
+        headers["api_key"] = ERGO_NODE_API_KEY
         
-        response = None
-        try:
-            if method == "GET":
-                response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            elif method == "POST":
-                response = await client.post(url, headers=headers, params=params, json=json_data, timeout=30.0)
-            else:
-                logger.error(f"Unsupported HTTP method: {method}")
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            # Log raw response details before processing
-            response_text = await response.aread() # Read content efficiently
-            logger.debug(f"Node API Response: Status={response.status_code}, Headers={response.headers}, Raw Body='{response_text.decode('utf-8', errors='replace')}'")
-            
-            response.raise_for_status()
-            # Attempt to parse JSON *after* logging raw response and checking status
-            return response.json()
+    # Log request details before sending
+    logger.debug(f"Node API Request: Method={method}, URL={url}, Params={params}, JSON={json_data}, Headers={headers}")
+    
+    response = None
+    try:
+        if method == "GET":
+            response = await client.get(url, headers=headers, params=params, timeout=30.0)
+        elif method == "POST":
+            response = await client.post(url, headers=headers, params=params, json=json_data, timeout=30.0)
+        else:
+            logger.error(f"Unsupported HTTP method: {method}")
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Log raw response details before processing
+        response_text = await response.aread() # Read content efficiently
+        logger.debug(f"Node API Response: Status={response.status_code}, Headers={response.headers}, Raw Body='{response_text.decode('utf-8', errors='replace')}'")
         
-        except httpx.RequestError as exc:
-            logger.error(f"An error occurred while requesting {exc.request.url!r}: {exc}")
-            # Re-raise or handle as appropriate for the application
-            raise 
-        except httpx.HTTPStatusError as exc:
-            logger.error(f"Error response {exc.response.status_code} while requesting {exc.request.url!r}: {exc}")
-            # Log the response body that caused the error, which we already captured
-            # Re-raise or handle as appropriate
-            raise
-        except Exception as exc:
-            # Catch potential JSONDecodeError or other unexpected errors
-            logger.error(f"An unexpected error occurred during Node API call to {url}: {exc}", exc_info=True)
-            # Log response details if available
-            if response:
-                 logger.error(f"Response details on error: Status={response.status_code}, Headers={response.headers}")
-                 # Raw body already logged in DEBUG level
-            raise
+        response.raise_for_status()
+        # Attempt to parse JSON *after* logging raw response and checking status
+        return response.json()
+    
+    except httpx.RequestError as exc:
+        logger.error(f"An error occurred while requesting {exc.request.url!r}: {exc}")
+        # Re-raise or handle as appropriate for the application
+        raise 
+    except httpx.HTTPStatusError as exc:
+        logger.error(f"Error response {exc.response.status_code} while requesting {exc.request.url!r}: {exc}")
+        # Log the response body that caused the error, which we already captured
+        # Re-raise or handle as appropriate
+        raise
+    except Exception as exc:
+        # Catch potential JSONDecodeError or other unexpected errors
+        logger.error(f"An unexpected error occurred during Node API call to {url}: {exc}", exc_info=True)
+        # Log response details if available
+        if response:
+             logger.error(f"Response details on error: Status={response.status_code}, Headers={response.headers}")
+             # Raw body already logged in DEBUG level
+        raise
 
 # Blockchain API endpoints
 
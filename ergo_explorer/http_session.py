@@ -0,0 +1,79 @@
+"""
+Shared HTTP client for the Ergo Explorer MCP server.
+
+API helpers call get_client() instead of opening a new httpx.AsyncClient per
+request, so TCP/TLS connections to the explorer and node are kept alive and
+reused across calls. A client is bound to the event loop it was created on,
+so one client is kept per running loop. The MCP server closes its client on
+shutdown through client_lifespan(); scripts use shared_client().
+
+When the optional h2 package is installed (pip install "ergo-mcp[http2]"), the
+client negotiates HTTP/2 and multiplexes concurrent requests to a host over one
+connection; otherwise it uses a bounded pool of HTTP/1.1 keep-alive connections.
+"""
+
+import asyncio
+import importlib.util
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+import httpx
+
+# HTTP/2 requires the optional h2 package; httpx imports it itself when needed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Upper bound on open connections, so a large asyncio.gather of lookups queues
+# for a pooled connection instead of opening one socket per request
+MAX_CONNECTIONS = 20
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+# Number of server sessions currently inside client_lifespan()
+_active_sessions = 0
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS
+            )
+        )
+        _clients[loop] = client
+    return client
+
+async def close_client() -> None:
+    """Close the shared AsyncClient for the running event loop, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+@asynccontextmanager
+async def shared_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client and close it on exit, for scripts that own the event loop."""
+    try:
+        yield get_client()
+    finally:
+        await close_client()
+
+@asynccontextmanager
+async def client_lifespan(server: Any) -> AsyncIterator[Dict[str, Any]]:
+    """
+    FastMCP lifespan that closes the shared client when the server stops.
+
+    SSE servers enter the lifespan once per connected session, so the client
+    is only closed when the last active session ends.
+    """
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield {}
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_client()
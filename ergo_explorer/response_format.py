@@ -48,8 +48,15 @@ class ResponseMetadata:
     their context window usage when consuming API responses.
     """
     
+    # One metadata object is created per response, so avoid a per-instance __dict__
+    __slots__ = (
+        "start_time", "end_time", "execution_time_ms", "result_count",
+        "result_size_bytes", "is_truncated", "token_estimate",
+        "token_breakdown", "model_type",
+    )
+    
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.end_time: Optional[float] = None
         self.execution_time_ms: Optional[float] = None
         self.result_count: Optional[int] = None
@@ -64,9 +71,10 @@ class ResponseMetadata:
         Complete the timing measurement for the response.
         
         This calculates the execution time in milliseconds based on the
-        elapsed time since initialization.
+        elapsed time since initialization, using the monotonic
+        performance counter rather than wall-clock time.
         """
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         self.execution_time_ms = round((self.end_time - self.start_time) * 1000, 2)
     
     def set_result_metrics(self, data: Any, is_truncated: bool = False, size_bytes: Optional[int] = None, model_type: Optional[str] = None):
@@ -169,6 +177,8 @@ class MCPResponse:
     The response can be automatically converted to a dictionary or JSON string.
     """
     
+    __slots__ = ("status", "data", "error", "metadata", "model_type")
+    
     def __init__(self, data: Any = None, error: Optional[Dict[str, Any]] = None, status: str = "success", model_type: str = "claude"):
         """
         Initialize a standardized MCP response.
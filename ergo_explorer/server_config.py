@@ -7,6 +7,7 @@ This module handles the server configuration and setup.
 import os
 from mcp.server.fastmcp import FastMCP
 from ergo_explorer.logging_config import get_logger, init_root_logger
+from ergo_explorer.http_session import client_lifespan
 from ergo_explorer.api.routes import register_all_routes
 
 # Initialize root logger
@@ -17,8 +18,8 @@ logger = get_logger(__name__)
 
 def create_server():
     """Create and configure the MCP server."""
-    # Create MCP server
-    mcp = FastMCP("Ergo Explorer", dependencies=["httpx", "networkx"])
+    # Create MCP server; the lifespan closes the shared HTTP client on shutdown
+    mcp = FastMCP("Ergo Explorer", dependencies=["httpx", "networkx"], lifespan=client_lifespan)
     
     # Register all routes
     register_all_routes(mcp)
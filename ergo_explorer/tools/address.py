@@ -288,9 +288,6 @@ async def analyze_address(address: str, depth: int = 2, tx_limit: int = 5) -> st
         depth: How many layers of transactions to analyze (1-4, default: 2)
         tx_limit: Maximum transactions per address to analyze (default: 5)
     """
-    from ergo_explorer.api import fetch_transaction
-    from datetime import datetime
-    
     # Limit max depth to 4 for performance
     depth = min(depth, 4)
     
@@ -44,7 +44,7 @@ class PerformanceMonitor:
     
     def __init__(self):
         """Initialize the performance monitor."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.timers = {}
         self.counters = {}
         self.memory_usage = []
@@ -54,14 +54,13 @@ class PerformanceMonitor:
     
     def start_timer(self, name: str):
         """Start a named timer."""
-        self.timers[name] = {"start": time.time(), "elapsed": 0}
+        self.timers[name] = {"start": time.perf_counter(), "elapsed": 0}
     
     def stop_timer(self, name: str):
         """Stop a named timer and update elapsed time."""
         if name in self.timers:
-            elapsed = time.time() - self.timers[name]["start"]
+            elapsed = time.perf_counter() - self.timers[name]["start"]
             self.timers[name]["elapsed"] += elapsed
-            self.timers[name]["stop"] = time.time()
             return elapsed
         return 0
     
@@ -86,7 +85,7 @@ class PerformanceMonitor:
     
     def get_detailed_metrics(self):
         """Get all collected metrics as a dictionary."""
-        total_time = time.time() - self.start_time
+        total_time = time.perf_counter() - self.start_time
         
         metrics = {
             "total_execution_time_seconds": round(total_time, 3),
@@ -134,7 +133,7 @@ class EntityDetector:
         
         # Performance tracking
         self.transactions_analyzed = 0
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.performance_metrics = {
             "transaction_fetch_time": 0,
             "transaction_analysis_time": 0,
@@ -263,7 +262,7 @@ class EntityDetector:
             txs: List of transaction data to analyze
         """
         self.monitor.start_timer("analyze_transactions")
-        analysis_start = time.time()
+        analysis_start = time.perf_counter()
         
         # Handle case when txs is not a list (e.g., a string or error message)
         if not isinstance(txs, list):
@@ -322,7 +321,7 @@ class EntityDetector:
         self.transactions_analyzed += len(txs)
         
         # Update performance metrics
-        analysis_time = time.time() - analysis_start
+        analysis_time = time.perf_counter() - analysis_start
         self.performance_metrics["transaction_analysis_time"] += analysis_time
         
         # Capture memory after full analysis
@@ -601,7 +600,7 @@ async def identify_entities(address: str, depth: int = 2, tx_limit: int = 20,
     global_monitor = PerformanceMonitor()
     global_monitor.start_timer("total")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     global_monitor.capture_memory_usage("start")
     
     if depth < 1:
@@ -629,7 +628,7 @@ async def identify_entities(address: str, depth: int = 2, tx_limit: int = 20,
     
     # Track time spent fetching transactions
     global_monitor.start_timer("transaction_fetching")
-    fetch_start_time = time.time()
+    fetch_start_time = time.perf_counter()
     
     # Track success/failure statistics
     stats = {
@@ -739,14 +738,14 @@ async def identify_entities(address: str, depth: int = 2, tx_limit: int = 20,
     
     # Update performance metrics
     global_monitor.stop_timer("transaction_fetching")
-    detector.performance_metrics["transaction_fetch_time"] = time.time() - fetch_start_time
+    detector.performance_metrics["transaction_fetch_time"] = time.perf_counter() - fetch_start_time
     
     # Add request statistics to performance metrics
     detector.performance_metrics["fetch_stats"] = stats
     
     # Identify clusters
     global_monitor.start_timer("clustering")
-    clustering_start = time.time()
+    clustering_start = time.perf_counter()
     try:
         address_to_cluster, relationships = detector.identify_clusters()
     except Exception as e:
@@ -755,11 +754,11 @@ async def identify_entities(address: str, depth: int = 2, tx_limit: int = 20,
         address_to_cluster = {}
         relationships = []
     
-    detector.performance_metrics["clustering_time"] = time.time() - clustering_start
+    detector.performance_metrics["clustering_time"] = time.perf_counter() - clustering_start
     global_monitor.stop_timer("clustering")
     
     # Calculate total time
-    detector.performance_metrics["total_time"] = time.time() - start_time
+    detector.performance_metrics["total_time"] = time.perf_counter() - start_time
     
     # Collect final results
     addresses = list(detector.address_set)
@@ -817,9 +816,9 @@ async def fetch_transactions_in_parallel(addresses: List[str], tx_limit: int,
         async with semaphore:
             try:
                 logger.debug(f"Fetching transactions for {address} (limit: {tx_limit})")
-                start = time.time()
+                start = time.perf_counter()
                 result = await fetch_address_transactions(address, limit=tx_limit)
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 logger.debug(f"Fetched transactions for {address} in {duration:.2f}s")
                 return address, result
             except Exception as e:
@@ -869,7 +868,7 @@ async def identify_entities_json(address: str, depth: int = 2, tx_limit: int = 1
     Returns:
         JSON string with entity identification results
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Increase both depth and tx_limit to find more relationships
@@ -923,7 +922,7 @@ async def identify_entities_json(address: str, depth: int = 2, tx_limit: int = 1
                                 "inferred": True
                             })
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         # Extract request stats if available
         request_stats = performance_metrics.get("fetch_stats", {})
@@ -1041,7 +1040,7 @@ async def identify_entities_json(address: str, depth: int = 2, tx_limit: int = 1
             "addresses": [address],
             "error": str(e),
             "performance": {
-                "total_time_ms": int((time.time() - start_time) * 1000),
+                "total_time_ms": int((time.perf_counter() - start_time) * 1000),
                 "error": True
             }
         }
@@ -11,6 +11,7 @@ import functools
 import time
 from typing import Dict, List, Any, Optional, Union, Tuple
 from ergo_explorer.logging_config import get_logger
+from ergo_explorer.http_session import get_client
 
 # Get module-specific logger
 logger = get_logger("token_holders.api")
@@ -63,38 +64,38 @@ async def fetch_node_api(endpoint: str, params: Optional[Dict] = None, method: s
     url = f"{NODE_API}/{endpoint}"
     logger.debug(f"Requesting: {url} with method={method}, params={params}")
     
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Content-Type": "application/json"
-        }
+    client = get_client()
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Content-Type": "application/json"
+    }
+    
+    # Add API key if available
+    if NODE_API_KEY:
+        headers["api_key"] = NODE_API_KEY
         
-        # Add API key if available
-        if NODE_API_KEY:
-            headers["api_key"] = NODE_API_KEY
-            
-        try:
-            if method == "GET":
-                response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            elif method == "POST":
-                response = await client.post(url, headers=headers, params=params, json=json_data, timeout=30.0)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
-            # Log response status
-            logger.debug(f"Response status: {response.status_code}")
-            
-            # Check for error status codes
-            response.raise_for_status()
+    try:
+        if method == "GET":
+            response = await client.get(url, headers=headers, params=params, timeout=30.0)
+        elif method == "POST":
+            response = await client.post(url, headers=headers, params=params, json=json_data, timeout=30.0)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
             
-            # Parse JSON response
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            return {"error": f"HTTP error: {e.response.status_code}", "details": e.response.text}
-        except Exception as e:
-            logger.error(f"Error in fetch_node_api: {str(e)}")
-            return {"error": str(e)}
+        # Log response status
+        logger.debug(f"Response status: {response.status_code}")
+        
+        # Check for error status codes
+        response.raise_for_status()
+        
+        # Parse JSON response
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
+        return {"error": f"HTTP error: {e.response.status_code}", "details": e.response.text}
+    except Exception as e:
+        logger.error(f"Error in fetch_node_api: {str(e)}")
+        return {"error": str(e)}
 
 @with_retry(max_retries=3, delay=1)
 async def fetch_explorer_api(endpoint: str, params: Optional[Dict] = None) -> Dict:
@@ -102,26 +103,26 @@ async def fetch_explorer_api(endpoint: str, params: Optional[Dict] = None) -> Di
     url = f"{EXPLORER_API}/{endpoint}"
     logger.debug(f"Requesting Explorer API: {url} with params={params}")
     
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Content-Type": "application/json"
-        }
-            
-        try:
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-                
-            # Log response status
-            logger.debug(f"Explorer API response status: {response.status_code}")
-            
-            # Check for error status codes
-            response.raise_for_status()
+    client = get_client()
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Content-Type": "application/json"
+    }
+        
+    try:
+        response = await client.get(url, headers=headers, params=params, timeout=30.0)
             
-            # Parse JSON response
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error from Explorer API: {e.response.status_code} - {e.response.text}")
-            return {"error": f"HTTP error: {e.response.status_code}", "details": e.response.text}
-        except Exception as e:
-            logger.error(f"Error in fetch_explorer_api: {str(e)}")
-            return {"error": str(e)} 
\ No newline at end of file
+        # Log response status
+        logger.debug(f"Explorer API response status: {response.status_code}")
+        
+        # Check for error status codes
+        response.raise_for_status()
+        
+        # Parse JSON response
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP error from Explorer API: {e.response.status_code} - {e.response.text}")
+        return {"error": f"HTTP error: {e.response.status_code}", "details": e.response.text}
+    except Exception as e:
+        logger.error(f"Error in fetch_explorer_api: {str(e)}")
+        return {"error": str(e)} 
\ No newline at end of file
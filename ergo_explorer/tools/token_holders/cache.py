@@ -4,7 +4,6 @@ Cache management for token holder data
 This module provides caching functionality to improve performance for
 token holder analysis operations.
 """
-import json
 import os
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -12,6 +11,7 @@ import logging
 from pathlib import Path
 from ergo_explorer.logging_config import get_logger
 from ergo_explorer.config import CACHE_TIMEOUT
+from ergo_explorer.util.json_utils import dumps_pretty, loads
 
 # Get module-specific logger
 logger = get_logger("token_holders.cache")
@@ -75,9 +75,12 @@ def save_token_history_to_disk(token_id: str, history_data: Dict[str, Any]) -> b
         # Create a file path for this token's history
         file_path = cache_dir / f"{token_id}.json"
         
+        # Serialize the whole document before touching the file, so an
+        # unserializable value can't leave a truncated cache file behind
+        data = dumps_pretty(history_data)
+        
         # Write the data to disk with pretty formatting
-        with open(file_path, 'w') as f:
-            json.dump(history_data, f, indent=2)
+        file_path.write_bytes(data)
         
         logger.debug(f"Successfully saved token history for {token_id} to disk")
         return True
@@ -106,9 +109,10 @@ def load_token_history_from_disk(token_id: str) -> Optional[Dict[str, Any]]:
             logger.debug(f"No token history file found for {token_id}")
             return None
         
-        # Read the data from disk
-        with open(file_path, 'r') as f:
-            history_data = json.load(f)
+        # Read the raw bytes and parse them directly; loads accepts UTF-8
+        # bytes, so no text-mode decode/newline translation is needed
+        with open(file_path, 'rb') as f:
+            history_data = loads(f.read())
         
         logger.debug(f"Successfully loaded token history for {token_id} from disk")
         return history_data
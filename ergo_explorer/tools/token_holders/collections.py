@@ -6,16 +6,92 @@ This module provides functionality for working with NFT collections.
 
 import asyncio
 import time
-from typing import Dict, List, Union
+from collections import defaultdict
+from typing import Dict, List, Optional
 from ergo_explorer.logging_config import get_logger
 from .api import fetch_node_api, fetch_explorer_api
 from .tokens import get_token_by_id
 from .boxes import get_box_by_id, get_unspent_boxes_by_token_id, get_boxes_by_token_id
 from .cache import _CACHE
 
+# Resolve the optional Explorer search helper once at import time
+try:
+    from ergo_explorer.api.explorer import search_tokens
+except ImportError:
+    search_tokens = None
+
 # Get module-specific logger
 logger = get_logger("token_holders.collections")
 
+# Maximum number of token validation lookups in flight while scanning a page
+MAX_CONCURRENT_TOKEN_LOOKUPS = 10
+
+def _r7_string(box: Dict) -> Optional[str]:
+    """
+    Get the serialized R7 register value of a box.
+    
+    Args:
+        box: Box data from the node or Explorer API
+        
+    Returns:
+        R7 as a serialized hex string (node boxes store it directly, Explorer
+        boxes as a register dict), or None if the box has no R7
+    """
+    r7_data = box.get("additionalRegisters", {}).get("R7")
+    if isinstance(r7_data, str):
+        return r7_data
+    if isinstance(r7_data, dict):
+        return r7_data.get("serializedValue")
+    return None
+
+def _find_collection_nft_candidates(boxes: List[Dict], collection_pattern: str) -> List[str]:
+    """
+    Scan a page of boxes for NFTs that reference a collection, without any I/O.
+    
+    Args:
+        boxes: Boxes containing the collection token
+        collection_pattern: Hex pattern identifying the collection in R7
+        
+    Returns:
+        Box IDs (and so candidate NFT token IDs) whose R7 contains the pattern
+    """
+    candidate_ids = []
+    for box in boxes:
+        box_id = box.get("boxId")
+        if not box_id:
+            continue
+            
+        # If R7 contains the collection token pattern, box ID is an NFT token ID
+        r7 = _r7_string(box)
+        if r7 and collection_pattern in r7:
+            candidate_ids.append(box_id)
+    return candidate_ids
+
+async def _validate_collection_nfts(candidate_ids: List[str]) -> List[str]:
+    """
+    Look up candidate NFT IDs concurrently and keep those that are valid tokens.
+    
+    Lookups are bounded by MAX_CONCURRENT_TOKEN_LOOKUPS so a dense page
+    doesn't flood the node.
+    
+    Args:
+        candidate_ids: Candidate NFT token IDs
+        
+    Returns:
+        The candidate IDs that resolved to a token, in their original order
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOKEN_LOOKUPS)
+    
+    async def get_token_bounded(token_id):
+        async with semaphore:
+            return await get_token_by_id(token_id)
+    
+    token_infos = await asyncio.gather(*(get_token_bounded(token_id) for token_id in candidate_ids))
+    return [
+        token_id for token_id, token_info in zip(candidate_ids, token_infos)
+        if "error" not in token_info
+    ]
+
 async def get_collection_metadata(collection_id: str) -> Dict:
     """
     Get NFT collection metadata based on EIP-34 standard with caching support.
@@ -139,6 +215,7 @@ async def get_collection_nfts(collection_id: str, limit: int = 100, use_cache: b
             return cached_nfts["nfts"][:limit]
     
     collection_nfts = []
+    seen_nfts = set()  # Membership checks for collection_nfts, which keeps discovery order
     
     # The correct pattern to look for in R7 register
     collection_pattern = f"0e20{collection_id}"
@@ -161,32 +238,16 @@ async def get_collection_nfts(collection_id: str, limit: int = 100, use_cache: b
                         logger.debug(f"No more boxes found at offset {offset}")
                         break
                         
-                    # Process each box to find NFTs
-                    for box in boxes:
-                        box_id = box.get("boxId")
-                        if not box_id:
-                            continue
-                            
-                        # Check if the box has R7 register with the collection token pattern
-                        additional_registers = box.get("additionalRegisters", {})
-                        r7_value = None
-                        
-                        if "R7" in additional_registers:
-                            r7_data = additional_registers["R7"]
-                            if isinstance(r7_data, str):
-                                r7_value = r7_data
-                            elif isinstance(r7_data, dict):
-                                r7_value = r7_data.get("serializedValue", "")
-                            
-                        # If R7 contains the collection token pattern, box ID is an NFT token ID
-                        if r7_value and collection_pattern in r7_value:
-                            logger.debug(f"Found NFT box with ID {box_id} for collection {collection_id}")
-                            # Verify it's a valid token before adding
-                            token_info = await get_token_by_id(box_id)
-                            if "error" not in token_info:
-                                if box_id not in collection_nfts:
-                                    collection_nfts.append(box_id)
-                                    logger.info(f"Added NFT {box_id} to collection {collection_id}")
+                    # Phase 1: scan the page for NFT candidates in memory
+                    candidate_ids = _find_collection_nft_candidates(boxes, collection_pattern)
+                    logger.debug(f"Found {len(candidate_ids)} NFT candidates for collection {collection_id} at offset {offset}")
+                    
+                    # Phase 2: verify all of the page's candidates are valid tokens at once
+                    for box_id in await _validate_collection_nfts(candidate_ids):
+                        if box_id not in seen_nfts:
+                            seen_nfts.add(box_id)
+                            collection_nfts.append(box_id)
+                            logger.info(f"Added NFT {box_id} to collection {collection_id}")
                         
                         # If we have enough NFTs, stop
                         if len(collection_nfts) >= limit:
@@ -210,9 +271,6 @@ async def get_collection_nfts(collection_id: str, limit: int = 100, use_cache: b
     except Exception as e:
         logger.error(f"Error getting collection NFTs: {str(e)}")
     
-    # Deduplicate the NFTs
-    collection_nfts = list(dict.fromkeys(collection_nfts))
-    
     # Store in cache if enabled
     if use_cache:
         complete = len(collection_nfts) < limit
@@ -236,13 +294,13 @@ async def process_nft_holders(nft_id: str) -> Dict:
         Dictionary with holder data for this NFT
     """
     try:
-        # Get token info
-        token_info = await get_token_by_id(nft_id)
+        # Get token info and all boxes containing this token concurrently
+        token_info, unspent_boxes = await asyncio.gather(
+            get_token_by_id(nft_id),
+            get_unspent_boxes_by_token_id(nft_id)
+        )
         if "error" in token_info:
             return None
-            
-        # Get all boxes containing this token
-        unspent_boxes = await get_unspent_boxes_by_token_id(nft_id)
         
         if not unspent_boxes:
             return {
@@ -338,41 +396,43 @@ async def get_collection_holders(collection_id: str, include_raw: bool = False,
             del _CACHE["holders"][collection_id]
             
     try:
-        # Get collection metadata
-        collection_metadata = await get_collection_metadata(collection_id)
-        if "error" in collection_metadata:
-            return {"error": collection_metadata["error"]}
+        # Start discovering the collection's NFTs while its metadata is
+        # fetched; discovery is cancelled if the metadata lookup fails, so a
+        # token that isn't a collection doesn't pay for a full box scan
+        nfts_task = asyncio.ensure_future(
+            get_collection_nfts(collection_id, limit=1000, use_cache=use_cache)
+        )
+        try:
+            collection_metadata = await get_collection_metadata(collection_id)
+            if "error" in collection_metadata:
+                return {"error": collection_metadata["error"]}
+            
+            nft_ids = await nfts_task
+        finally:
+            nfts_task.cancel()
             
-        # Get all NFTs in the collection
-        nft_ids = await get_collection_nfts(collection_id, limit=1000, use_cache=use_cache)
         if not nft_ids:
             return {"error": "No NFTs found in this collection"}
             
-        # Process NFTs in batches
-        processed_nft_ids = []
-        all_nft_holder_data = []
+        # Process NFTs concurrently with at most batch_size in flight; a
+        # semaphore keeps the pipe full instead of waiting on each batch's
+        # slowest NFT before starting the next batch
+        distinct_nft_count = len(nft_ids)  # Total unique NFT types
+        semaphore = asyncio.Semaphore(batch_size)
         
-        for i in range(0, len(nft_ids), batch_size):
-            batch = nft_ids[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(nft_ids)+batch_size-1)//batch_size}")
-            
-            # Process each NFT concurrently
-            batch_tasks = []
-            for nft_id in batch:
-                batch_tasks.append(process_nft_holders(nft_id))
-                processed_nft_ids.append(nft_id)
-                
-            # Wait for all batch tasks to complete
-            batch_results = await asyncio.gather(*batch_tasks)
-            all_nft_holder_data.extend([r for r in batch_results if r is not None])
+        async def process_bounded(nft_id):
+            async with semaphore:
+                return await process_nft_holders(nft_id)
+        
+        logger.info(f"Processing {distinct_nft_count} NFTs with up to {batch_size} in flight")
+        results = await asyncio.gather(*(process_bounded(nft_id) for nft_id in nft_ids))
+        all_nft_holder_data = [r for r in results if r is not None]
         
         # Improved holder aggregation to avoid duplicates
-        # Track which addresses hold which NFTs
-        address_to_nfts = {}  # Maps addresses to sets of NFT IDs they hold
-        all_holders = set()   # Set of all unique holder addresses
-        distinct_nft_count = len(processed_nft_ids)  # Total unique NFT types
+        # Track which addresses hold which NFTs in a single pass; its keys
+        # are the unique holder addresses
+        address_to_nfts = defaultdict(set)  # Maps addresses to sets of NFT IDs they hold
         
-        # First pass: collect which NFTs each address holds
         for nft_data in all_nft_holder_data:
             nft_id = nft_data.get("token_id")
             if not nft_id:
@@ -380,20 +440,8 @@ async def get_collection_holders(collection_id: str, include_raw: bool = False,
                 
             for holder in nft_data.get("holders", []):
                 address = holder.get("address")
-                if not address:
-                    continue
-                    
-                all_holders.add(address)
-                
-                if address not in address_to_nfts:
-                    address_to_nfts[address] = set()
-                
-                address_to_nfts[address].add(nft_id)
-        
-        # Now calculate the NFT count for each address
-        address_nft_counts = {}
-        for address, nft_set in address_to_nfts.items():
-            address_nft_counts[address] = len(nft_set)
+                if address:
+                    address_to_nfts[address].add(nft_id)
         
         # Build the result
         result = {
@@ -401,20 +449,21 @@ async def get_collection_holders(collection_id: str, include_raw: bool = False,
             "collection_name": collection_metadata.get("token_name", "Unknown Collection"),
             "collection_description": collection_metadata.get("token_description", ""),
             "total_nfts": distinct_nft_count,
-            "total_holders": len(all_holders),
+            "total_holders": len(address_to_nfts),
             "holders": []
         }
         
-        # Add holder information
-        for address, nft_count in address_nft_counts.items():
+        # Add holder information, counting each address's NFT set once
+        holders = result["holders"]
+        for address, nft_set in address_to_nfts.items():
+            nft_count = len(nft_set)
             percentage = (nft_count / distinct_nft_count * 100) if distinct_nft_count > 0 else 0
-            holder_info = {
+            holders.append({
                 "address": address,
                 "nft_count": nft_count,
                 "percentage": round(percentage, 2),
-                "nfts_held": list(address_to_nfts[address])  # Include which NFTs the address holds
-            }
-            result["holders"].append(holder_info)
+                "nfts_held": list(nft_set)  # Include which NFTs the address holds
+            })
         
         # Sort holders by NFT count in descending order
         result["holders"].sort(key=lambda x: x["nft_count"], reverse=True)
@@ -482,11 +531,9 @@ async def search_collections(query: str, limit: int = 10) -> Dict:
                 }
         
         # Search for tokens using Explorer API
-        # (assuming this is implemented elsewhere in the codebase)
-        try:
-            from ergo_explorer.api.explorer import search_tokens
+        if search_tokens is not None:
             response = await search_tokens(query)
-        except ImportError:
+        else:
             # Fallback: use our own explorer search
             response = await fetch_explorer_api("tokens/search", {"query": query, "limit": limit * 2})
         
@@ -498,8 +545,8 @@ async def search_collections(query: str, limit: int = 10) -> Dict:
         if not items:
             return {"items": [], "total": 0}
         
-        # Filter and process potential collections
-        collections = []
+        # Filter potential collections
+        candidates = []
         
         for token in items[:limit * 2]:
             token_id = token.get("id")
@@ -512,30 +559,47 @@ async def search_collections(query: str, limit: int = 10) -> Dict:
             if emission_amount and int(emission_amount) > 1000000:
                 continue
             
-            # Try to get collection metadata
-            try:
-                collection_metadata = await get_collection_metadata(token_id)
-                
-                # Skip if error or if the process couldn't extract metadata
-                if "error" in collection_metadata:
-                    continue
-                
-                # Add to results
-                collections.append({
-                    "collection_id": token_id,
-                    "name": collection_metadata.get("token_name", token.get("name", "Unknown")),
-                    "description": collection_metadata.get("token_description", token.get("description", "")),
-                    "logo_url": collection_metadata.get("logo_url", ""),
-                    "category": collection_metadata.get("category", "")
-                })
-                
-                # If we have enough results, stop
-                if len(collections) >= limit:
-                    break
-                    
-            except Exception as e:
-                logger.warning(f"Error processing potential collection {token_id}: {str(e)}")
+            candidates.append(token)
+        
+        # Fetch collection metadata for every candidate concurrently, bounded
+        # like the NFT validation lookups
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOKEN_LOOKUPS)
+        
+        async def get_metadata_bounded(token_id):
+            async with semaphore:
+                return await get_collection_metadata(token_id)
+        
+        metadata_results = await asyncio.gather(
+            *(get_metadata_bounded(token["id"]) for token in candidates),
+            return_exceptions=True
+        )
+        
+        # Keep the search order and stop once we have enough results
+        collections = []
+        
+        for token, collection_metadata in zip(candidates, metadata_results):
+            token_id = token["id"]
+            
+            if isinstance(collection_metadata, Exception):
+                logger.warning(f"Error processing potential collection {token_id}: {str(collection_metadata)}")
+                continue
+            
+            # Skip if error or if the process couldn't extract metadata
+            if "error" in collection_metadata:
                 continue
+            
+            # Add to results
+            collections.append({
+                "collection_id": token_id,
+                "name": collection_metadata.get("token_name", token.get("name", "Unknown")),
+                "description": collection_metadata.get("token_description", token.get("description", "")),
+                "logo_url": collection_metadata.get("logo_url", ""),
+                "category": collection_metadata.get("category", "")
+            })
+            
+            # If we have enough results, stop
+            if len(collections) >= limit:
+                break
         
         return {
             "items": collections,
@@ -55,7 +55,7 @@ async def track_token_transfers_by_boxes(
     Returns:
         Statistics about the tracking operation
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(f"Starting token transfer tracking for {token_id} using box API, max transactions: {max_transactions}")
     
     # Get token information
@@ -251,7 +251,7 @@ async def track_token_transfers_by_boxes(
     save_token_history_to_disk(token_id, history.to_dict())
     
     # Return statistics about the operation
-    execution_time_ms = int((time.time() - start_time) * 1000)
+    execution_time_ms = int((time.perf_counter() - start_time) * 1000)
     return {
         "token_id": token_id,
         "token_name": token_name,
@@ -4,6 +4,7 @@ Token operations
 This module provides functionality for working with Ergo tokens.
 """
 
+import asyncio
 from typing import Dict
 from ergo_explorer.logging_config import get_logger
 from .api import fetch_node_api
@@ -12,6 +13,20 @@ from .cache import _CACHE
 # Get module-specific logger
 logger = get_logger("token_holders.tokens")
 
+# Lookups currently in flight, so concurrent callers for the same token
+# share one request instead of each missing the cache
+_PENDING: Dict[str, asyncio.Future] = {}
+
+async def _fetch_token(token_id: str) -> Dict:
+    """Fetch token information from the node and cache it if the lookup succeeded."""
+    result = await fetch_node_api(f"blockchain/token/byId/{token_id}")
+    
+    # Add result to cache
+    if "error" not in result:
+        _CACHE["tokens"][token_id] = result
+    
+    return result
+
 async def get_token_by_id(token_id: str) -> Dict:
     """
     Get token information by ID with caching support.
@@ -27,10 +42,15 @@ async def get_token_by_id(token_id: str) -> Dict:
         logger.debug(f"Cache hit for token {token_id}")
         return _CACHE["tokens"][token_id]
     
-    result = await fetch_node_api(f"blockchain/token/byId/{token_id}")
+    pending = _PENDING.get(token_id)
+    if pending is not None:
+        logger.debug(f"Joining in-flight request for token {token_id}")
+        return await asyncio.shield(pending)
     
-    # Add result to cache
-    if "error" not in result:
-        _CACHE["tokens"][token_id] = result
-        
-    return result 
\ No newline at end of file
+    # Every caller, including this first one, awaits the shared task through
+    # a shield, so cancelling one caller doesn't cancel the lookup the others
+    # are waiting on; the task leaves _PENDING once it finishes
+    task = asyncio.ensure_future(_fetch_token(token_id))
+    _PENDING[token_id] = task
+    task.add_done_callback(lambda _: _PENDING.pop(token_id, None))
+    return await asyncio.shield(task) 
\ No newline at end of file
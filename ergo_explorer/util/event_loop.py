@@ -0,0 +1,44 @@
+"""
+Event loop helper for the standalone Ergo Explorer MCP scripts.
+
+The scripts run their top-level coroutine through run_async(), which uses
+uvloop when it is installed and falls back to asyncio.run otherwise, so
+callers don't each need their own optional-import block.
+
+Usage:
+    ```python
+    from ergo_explorer.util.event_loop import run_async
+
+    run_async(main())
+    ```
+
+Dependencies:
+    - uvloop (optional): For a faster event loop
+      If not available, fallback to the standard library asyncio loop
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+# uvloop is optional; use it as the event loop when it is installed
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop.
+
+    Args:
+        coro: The top-level coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
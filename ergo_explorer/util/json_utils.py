@@ -0,0 +1,76 @@
+"""
+JSON serialization helpers for Ergo Explorer MCP.
+
+These wrap orjson when it is installed and fall back to the standard library
+json module otherwise, so callers don't each need their own optional-import
+block.
+
+Usage:
+    ```python
+    from ergo_explorer.util.json_utils import dumps_pretty, loads
+
+    # Pretty-printed JSON bytes, ready to write to a file
+    data = dumps_pretty({"height": 1, "timestamp": datetime.now()})
+
+    # Parse JSON from bytes or str
+    obj = loads(data)
+    ```
+
+Dependencies:
+    - orjson (optional): For faster serialization and parsing
+      If not available, fallback to the standard library json module
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Union
+
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _default(obj: Any) -> Any:
+    """Serialize values the stdlib encoder doesn't handle natively (orjson handles datetimes itself)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_pretty(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize obj as JSON indented by two spaces.
+
+    Non-string dict keys are converted to strings and datetimes are written
+    in ISO format, with either backend.
+
+    Args:
+        obj: The object to serialize
+        sort_keys: Whether to sort dictionary keys
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, indent=2, sort_keys=sort_keys, default=_default).encode("utf-8")
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Both backends raise a ValueError subclass on invalid input.
+
+    Args:
+        data: The JSON document as bytes or str
+
+    Returns:
+        The parsed object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -42,12 +42,12 @@ def standardize_response(func: F) -> F:
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Dict[str, Any]:
-        start_time = time.time()
+        start_time = time.perf_counter()
         timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # If the result is already in the standard format, return it
             if (isinstance(result, dict) and 
@@ -82,7 +82,7 @@ def standardize_response(func: F) -> F:
             
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {str(e)}")
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             error_response = {
                 "status": "error",
@@ -179,7 +179,9 @@ def count_tokens(text: str, model_type: str = "claude") -> int:
         return len(text) // 4
     
     try:
-        tokens = tokenizer.encode(text)
+        # Response text is never meant to contain special tokens, so skip the
+        # special-token scan (and its ValueError on e.g. "<|endoftext|>")
+        tokens = tokenizer.encode_ordinary(text)
         return len(tokens)
     except Exception as e:
         logger.error(f"Error counting tokens: {str(e)}")
@@ -46,22 +46,22 @@ def process_interaction_data_for_viz(interaction_data: Dict[str, Any]) -> Dict[s
             node_type = "recurring"
             
         # Calculate node size based on interaction count (min 5, max 20)
-        interaction_count = interaction.get("incoming_count", 0) + interaction.get("outgoing_count", 0)
-        node_size = min(20, max(5, 5 + interaction_count))
+        incoming = interaction.get("incoming_count", 0)
+        outgoing = interaction.get("outgoing_count", 0)
+        node_size = min(20, max(5, 5 + incoming + outgoing))
         
-        # Create node
+        # Create node, titled by its known name or else its known type
+        name = interaction.get("name")
+        known_type = interaction.get("type")
         nodes.append({
             "id": node_id,
             "label": interaction.get("formatted_address", address),
             "type": node_type,
             "size": node_size,
-            "title": interaction.get("name", "") or ("Known: " + interaction.get("type", "Unknown")) if interaction.get("name") or interaction.get("type") else None,
+            "title": (name or "Known: " + known_type) if name or known_type else None,
         })
         
         # Create edges
-        incoming = interaction.get("incoming_count", 0)
-        outgoing = interaction.get("outgoing_count", 0)
-        
         if incoming > 0:
             edges.append({
                 "id": f"edge_in_{idx}",
@@ -13,6 +13,14 @@ TARGET_PATH="/etc/systemd/system/ergo-openwebui.service"
 LOG_DIR="$PROJECT_ROOT/logs"
 LOGROTATE_CONF="/etc/logrotate.d/ergo-openwebui"
 
+# Persistent pip download/wheel cache so venv rebuilds don't re-download
+# everything; prefer wheels so cache hits replace sdist builds
+export PIP_CACHE_DIR="${PIP_CACHE_DIR:-$HOME/.cache/ergo-mcp-pip}"
+export PIP_PREFER_BINARY=1
+# uv ignores the PIP_* settings; give it its own persistent cache, since
+# `uv cache clean`/`uv cache prune` would wipe a directory shared with pip
+export UV_CACHE_DIR="${UV_CACHE_DIR:-$HOME/.cache/ergo-mcp-uv}"
+
 # Log function for install script
 log() {
     local level=$1
@@ -28,6 +36,16 @@ log() {
     echo -e "${color}[$level] $message${NC}"
 }
 
+# Install packages into the active venv, using uv's much faster resolver and
+# installer when it is available and falling back to pip otherwise
+pip_install() {
+    if command -v uv > /dev/null 2>&1; then
+        uv pip install "$@"
+    else
+        pip install --disable-pip-version-check --no-input "$@"
+    fi
+}
+
 # Make sure we're in the project directory
 cd "$PROJECT_ROOT" || { log "ERROR" "Failed to change to project directory"; exit 1; }
 
@@ -35,32 +53,70 @@ cd "$PROJECT_ROOT" || { log "ERROR" "Failed to change to project directory"; exi
 mkdir -p "$LOG_DIR"
 log "INFO" "Created log directory: $LOG_DIR"
 
+# Make pip and uv cache directories if they don't exist
+mkdir -p "$PIP_CACHE_DIR" "$UV_CACHE_DIR"
+log "INFO" "Using pip cache directory: $PIP_CACHE_DIR"
+log "INFO" "Using uv cache directory: $UV_CACHE_DIR"
+
 # Make scripts executable
 log "INFO" "Making scripts executable"
 chmod +x "$PROJECT_ROOT/start_ergo_openwebui_prod.sh"
 chmod +x "$PROJECT_ROOT/stop_ergo_openwebui_prod.sh"
 
+# Stamp recording the requirements.txt hash of the last successful install
+VENV_STAMP="$PROJECT_ROOT/venv/.requirements.stamp"
+REQUIREMENTS_HASH=$(sha256sum "$PROJECT_ROOT/requirements.txt" | cut -d' ' -f1)
+
+# A venv whose interpreter no longer runs (e.g. the base Python was upgraded
+# or removed) can't be repaired in place; only then is it rebuilt
+if [ -d "$PROJECT_ROOT/venv" ] && ! "$PROJECT_ROOT/venv/bin/python" -I -c "" > /dev/null 2>&1; then
+    log "WARN" "Virtual environment is broken. Recreating..."
+    rm -rf "$PROJECT_ROOT/venv"
+fi
+
 # Verify the virtual environment exists
 if [ ! -d "$PROJECT_ROOT/venv" ]; then
     log "INFO" "Virtual environment not found. Creating..."
     python3 -m venv "$PROJECT_ROOT/venv"
     
-    # Activate and install dependencies
+    # Activate and install dependencies; upgrade the packaging tools in one
+    # pip run and skip pip's self-version check on every invocation
     source "$PROJECT_ROOT/venv/bin/activate"
-    pip install --upgrade pip
-    pip install -r "$PROJECT_ROOT/requirements.txt"
+    pip_install --upgrade pip setuptools wheel
+    pip_install -r "$PROJECT_ROOT/requirements.txt" && echo "$REQUIREMENTS_HASH" > "$VENV_STAMP"
     deactivate
     
     log "INFO" "Virtual environment created and dependencies installed"
+elif [ "$(cat "$VENV_STAMP" 2> /dev/null)" = "$REQUIREMENTS_HASH" ]; then
+    # The stamp holds the hash of the requirements.txt last verified or
+    # installed successfully, so it only matches after a run that succeeded
+    log "INFO" "Virtual environment found, requirements unchanged since last install"
 else
     log "INFO" "Virtual environment found"
+    
+    # Resolve requirements without installing and skip the real install only
+    # when the dry run itself succeeded and its report lists nothing to
+    # install; a failed dry run (network error, a pip without --report)
+    # falls through to the real install
+    source "$PROJECT_ROOT/venv/bin/activate"
+    if DRY_RUN_REPORT=$(pip install --disable-pip-version-check --no-input --dry-run --quiet --report - \
+            -r "$PROJECT_ROOT/requirements.txt") \
+        && printf '%s' "$DRY_RUN_REPORT" \
+        | python -I -c "import json, sys; sys.exit(1 if json.load(sys.stdin).get('install') else 0)" 2> /dev/null; then
+        log "INFO" "Dependencies already satisfied"
+        echo "$REQUIREMENTS_HASH" > "$VENV_STAMP"
+    else
+        log "INFO" "Updating dependencies in virtual environment"
+        pip_install -r "$PROJECT_ROOT/requirements.txt" && echo "$REQUIREMENTS_HASH" > "$VENV_STAMP"
+    fi
+    deactivate
 fi
 
 # Check if mcpo is installed in the virtual environment
 if [ ! -f "$PROJECT_ROOT/venv/bin/mcpo" ]; then
     log "INFO" "MCPO not found in virtual environment. Installing..."
     source "$PROJECT_ROOT/venv/bin/activate"
-    pip install mcpo>=0.0.12
+    pip_install "mcpo>=0.0.12"
     deactivate
     
     log "INFO" "MCPO installed"
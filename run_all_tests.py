@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Run the standalone test scripts in a single event loop.
+
+Each root-level test_*.py script is independent and spends most of its time
+waiting on the Ergo node, so their entry coroutines are launched together
+with asyncio.gather instead of one asyncio.run() per script.
+"""
+
+import asyncio
+import importlib
+import sys
+import time
+
+from ergo_explorer.http_session import shared_client
+from ergo_explorer.util.event_loop import run_async
+
+# (module, entry coroutine) for each standalone test script
+TEST_SCRIPTS = [
+    ("test_address_clustering", "test_entity_identification"),
+    ("test_address_viz", "test_visualization"),
+    ("test_api_fix", "main"),
+    ("test_api_interactions", "main"),
+    ("test_api_interactions_direct", "main"),
+    ("test_blockchain_address_viz_mcp", "test_address_viz"),
+    ("test_blockchain_status", "test_blockchain_status"),
+    ("test_box_based_token_history", "run_tests"),
+]
+
+async def run_all():
+    """Run every test script concurrently and report the outcome of each."""
+    names = []
+    coros = []
+    for module_name, func_name in TEST_SCRIPTS:
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            print(f"❌ {module_name}: import failed: {e}")
+            continue
+        names.append(module_name)
+        coros.append(getattr(module, func_name)())
+
+    # All scripts share one keep-alive client, closed once everything finishes
+    async with shared_client():
+        start = time.perf_counter()
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        elapsed = time.perf_counter() - start
+
+    failed = 0
+    print("\n" + "=" * 80)
+    for name, result in zip(names, results):
+        # test_entity_identification reports failure by returning False
+        if isinstance(result, BaseException) or result is False:
+            failed += 1
+            detail = f": {result}" if isinstance(result, BaseException) else ""
+            print(f"❌ {name}{detail}")
+        else:
+            print(f"✅ {name}")
+    failed += len(TEST_SCRIPTS) - len(names)
+    print(f"\n{len(TEST_SCRIPTS) - failed}/{len(TEST_SCRIPTS)} scripts passed in {elapsed:.2f}s")
+    return failed == 0
+
+if __name__ == "__main__":
+    sys.exit(0 if run_async(run_all()) else 1)
@@ -17,11 +17,12 @@ Requirements:
 import os
 import sys
 import json
+import time
 import inspect
 import importlib
 import asyncio
 import aiohttp
-import statistics
+import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
 import tiktoken
 from datetime import datetime
@@ -31,6 +32,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import the tools and routes
 from ergo_explorer.tools import address, blockchain, token, transaction, block, network, contracts, tokenomics, ergowatch
+from ergo_explorer.util.json_utils import dumps_pretty, loads
 
 # Create a tokenizer for token counting
 try:
@@ -56,124 +58,172 @@ TEST_DATA = {
     }
 }
 
-# Helper function to count tokens
-def count_tokens(text: str) -> int:
-    """Count the number of tokens in a text string using tiktoken."""
+# Concurrency limits so gathered tests do not overwhelm the local MCPO server
+MAX_CONCURRENT_REQUESTS = 8
+CONNECTION_POOL_LIMIT = 16
+
+# Endpoints to test, keyed by endpoint (module) name, mapping each function
+# to the request parameters it is called with (None for a bare GET)
+ENDPOINT_TESTS = {
+    "blockchain": {
+        "blockchain_status": None,
+        "get_address_full_balance": {"address": TEST_DATA["address"]["address"]},
+    },
+    "address": {
+        "get_transaction_history": {"address": TEST_DATA["address"]["address"]},
+        "analyze_address": {"address": TEST_DATA["address"]["address"]},
+    },
+    "token": {
+        "get_token_price": {"token_id": TEST_DATA["token"]["token_id"]},
+    },
+    "transaction": {
+        "analyze_transaction": {"tx_id": TEST_DATA["transaction"]["tx_id"]},
+    },
+    "block": {
+        "get_block_by_height": {"height": TEST_DATA["block"]["height"]},
+        "get_block_by_hash": {"hash": TEST_DATA["block"]["hash"]},
+        "get_latest_blocks": {"limit": 5},
+    },
+}
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Count tokens for many strings with a single batched tiktoken call."""
     if tokenizer is None:
-        return -1
+        return [-1] * len(texts)
     
     try:
-        tokens = tokenizer.encode(text)
-        return len(tokens)
+        # Encode each distinct payload once, spread across tokenizer threads
+        unique_texts = list(dict.fromkeys(texts))
+        token_lists = tokenizer.encode_ordinary_batch(unique_texts, num_threads=os.cpu_count() or 1)
+        counts = {text: len(tokens) for text, tokens in zip(unique_texts, token_lists)}
+        return [counts[text] for text in texts]
     except Exception as e:
         print(f"Error counting tokens: {e}")
-        return -1
+        return [-1] * len(texts)
 
-async def fetch_response(session: aiohttp.ClientSession, url: str, data: Dict = None) -> Dict:
-    """Fetch a response from the MCPO server."""
+def parse_json(raw: bytes) -> Any:
+    """
+    Parse a raw JSON body.
+    
+    Bodies that are not JSON (e.g. HTML error pages) are reported as an
+    error carrying the start of the body.
+    """
+    try:
+        return loads(raw)
+    except ValueError:
+        return {"error": raw[:200].decode('utf-8', errors='replace')}
+
+async def fetch_response(session: aiohttp.ClientSession, url: str, data: Dict = None) -> Tuple[bytes, Dict]:
+    """
+    Fetch a response from the MCPO server.
+    
+    Returns:
+        Tuple of (raw response body, parsed JSON response)
+    """
     try:
         if data:
             async with session.post(url, json=data) as response:
-                return await response.json()
+                raw = await response.read()
         else:
             async with session.get(url) as response:
-                return await response.json()
+                raw = await response.read()
+        return raw, parse_json(raw)
     except Exception as e:
         print(f"Error fetching {url}: {e}")
-        return {"error": str(e)}
+        error = {"error": str(e)}
+        return json.dumps(error, ensure_ascii=False).encode('utf-8'), error
 
 async def test_endpoint(session: aiohttp.ClientSession, endpoint_name: str, 
-                        func_name: str, params: Dict = None) -> Dict[str, Any]:
-    """Test an endpoint with the provided parameters and return response metrics."""
+                        func_name: str, params: Dict = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Test an endpoint with the provided parameters and return response metrics.
+    
+    Token counts are filled in afterwards by analyze_endpoints in one batch,
+    so the decoded response body is returned alongside the metrics.
+    """
     base_url = "http://localhost:3001/api"  # Adjust if your MCPO server runs on a different port
     
     url = f"{base_url}/{endpoint_name}/{func_name}"
     
-    start_time = datetime.now()
-    response = await fetch_response(session, url, params)
-    end_time = datetime.now()
-    
-    response_time = (end_time - start_time).total_seconds() * 1000  # in milliseconds
-    
-    # Convert the response to a JSON string for token counting
-    response_str = json.dumps(response, ensure_ascii=False)
-    token_count = count_tokens(response_str)
+    start_ns = time.perf_counter_ns()
+    raw, response = await fetch_response(session, url, params)
+    response_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # in milliseconds
     
-    response_size = len(response_str.encode('utf-8'))
+    # Size and count tokens on the body as received instead of re-serializing
+    response_size = len(raw)
+    response_str = raw.decode('utf-8', errors='replace')
     
     return {
         "endpoint": f"{endpoint_name}/{func_name}",
         "response_time_ms": response_time,
         "response_size_bytes": response_size,
-        "estimated_token_count": token_count,
+        "estimated_token_count": -1,
         "status": "success" if "error" not in response else "error",
         "error": response.get("error") if "error" in response else None
-    }
+    }, response_str
 
 async def analyze_endpoints():
     """Analyze all MCPO endpoints and generate a report."""
-    # Dictionary to store module name to endpoint mappings
-    module_to_endpoint = {
-        "blockchain": "blockchain",
-        "address": "address",
-        "token": "token",
-        "transaction": "transaction",
-        "block": "block",
-        "network": "network",
-        "contracts": "contracts",
-        "tokenomics": "tokenomics",
-        "ergowatch": "ergowatch"
+    # Tool modules backing each endpoint
+    modules = {
+        "blockchain": blockchain,
+        "address": address,
+        "token": token,
+        "transaction": transaction,
+        "block": block,
+        "network": network,
+        "contracts": contracts,
+        "tokenomics": tokenomics,
+        "ergowatch": ergowatch
     }
     
-    # List to store endpoint test results
-    results = []
+    # Endpoint tests to run; they are independent, so they are awaited together
+    tasks = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
-    async with aiohttp.ClientSession() as session:
-        # Test blockchain endpoints
-        blockchain_funcs = [f for f in dir(blockchain) if not f.startswith('_') and callable(getattr(blockchain, f))]
-        for func_name in blockchain_funcs:
-            if func_name == "blockchain_status":
-                results.append(await test_endpoint(session, "blockchain", func_name))
-            elif func_name == "get_address_full_balance":
-                results.append(await test_endpoint(session, "blockchain", func_name, 
-                                                  {"address": TEST_DATA["address"]["address"]}))
-        
-        # Test address endpoints
-        address_funcs = [f for f in dir(address) if not f.startswith('_') and callable(getattr(address, f))]
-        for func_name in address_funcs:
-            if func_name in ["get_transaction_history", "analyze_address"]:
-                results.append(await test_endpoint(session, "address", func_name,
-                                                 {"address": TEST_DATA["address"]["address"]}))
-        
-        # Test token endpoints
-        token_funcs = [f for f in dir(token) if not f.startswith('_') and callable(getattr(token, f))]
-        for func_name in token_funcs:
-            if func_name == "get_token_price":
-                results.append(await test_endpoint(session, "token", func_name,
-                                                 {"token_id": TEST_DATA["token"]["token_id"]}))
-        
-        # Test transaction endpoints
-        tx_funcs = [f for f in dir(transaction) if not f.startswith('_') and callable(getattr(transaction, f))]
-        for func_name in tx_funcs:
-            if func_name == "analyze_transaction":
-                results.append(await test_endpoint(session, "transaction", func_name,
-                                                 {"tx_id": TEST_DATA["transaction"]["tx_id"]}))
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    connector = aiohttp.TCPConnector(limit=CONNECTION_POOL_LIMIT,
+                                     limit_per_host=CONNECTION_POOL_LIMIT,
+                                     keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        for endpoint_name, func_params in ENDPOINT_TESTS.items():
+            module = modules[endpoint_name]
+            for func_name, params in func_params.items():
+                # Only test functions the tool module actually implements
+                if hasattr(module, func_name):
+                    tasks.append(bounded(test_endpoint(session, endpoint_name, func_name, params)))
         
-        # Test block endpoints
-        block_funcs = [f for f in dir(block) if not f.startswith('_') and callable(getattr(block, f))]
-        for func_name in block_funcs:
-            if func_name == "get_block_by_height":
-                results.append(await test_endpoint(session, "block", func_name,
-                                                 {"height": TEST_DATA["block"]["height"]}))
-            elif func_name == "get_block_by_hash":
-                results.append(await test_endpoint(session, "block", func_name,
-                                                 {"hash": TEST_DATA["block"]["hash"]}))
-            elif func_name == "get_latest_blocks":
-                results.append(await test_endpoint(session, "block", func_name,
-                                                 {"limit": 5}))
+        # Run all endpoint tests concurrently over the shared session
+        gathered = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    results = []
+    to_count = []
+    for outcome in gathered:
+        if isinstance(outcome, Exception):
+            print(f"Error testing endpoint: {outcome}")
+            continue
+        result, response_str = outcome
+        results.append(result)
+        # Error responses are excluded from the report statistics, so their
+        # token count is left at -1 rather than spending tokenizer time on them
+        if result["status"] == "success":
+            to_count.append((result, response_str))
+    
+    # Count tokens for all successful responses in a single batched tokenizer call
+    token_counts = count_tokens_batch([response_str for _, response_str in to_count])
+    for (result, _), token_count in zip(to_count, token_counts):
+        result["estimated_token_count"] = token_count
     
     return results
 
+def _report_number(value: float):
+    """Convert a numpy statistic to a Python number, keeping integral values as int like statistics does."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
 def generate_report(results: List[Dict[str, Any]]) -> None:
     """Generate a report of endpoint token estimates."""
     # Sort results by token count (descending)
@@ -183,11 +233,12 @@ def generate_report(results: List[Dict[str, Any]]) -> None:
     successful_results = [r for r in results if r["status"] == "success" and r["estimated_token_count"] > 0]
     
     if successful_results:
-        token_counts = [r["estimated_token_count"] for r in successful_results]
-        avg_token_count = statistics.mean(token_counts)
-        median_token_count = statistics.median(token_counts)
-        min_token_count = min(token_counts)
-        max_token_count = max(token_counts)
+        token_counts = np.fromiter((r["estimated_token_count"] for r in successful_results),
+                                   dtype=np.int64, count=len(successful_results))
+        avg_token_count = _report_number(token_counts.mean())
+        median_token_count = _report_number(np.median(token_counts))
+        min_token_count = int(token_counts.min())
+        max_token_count = int(token_counts.max())
         total_endpoints = len(results)
         successful_endpoints = len(successful_results)
         
@@ -214,9 +265,9 @@ def generate_report(results: List[Dict[str, Any]]) -> None:
             endpoint = result["endpoint"]
             size = result.get("response_size_bytes", 0)
             tokens = result.get("estimated_token_count", "N/A")
-            time = f"{result.get('response_time_ms', 0):.2f}"
+            time_ms = f"{result.get('response_time_ms', 0):.2f}"
             
-            print(f"{endpoint:<40} {status:<10} {size:<15} {tokens:<10} {time:<10}")
+            print(f"{endpoint:<40} {status:<10} {size:<15} {tokens:<10} {time_ms:<10}")
         
         print("\n")
         print("Recommendations for Future Endpoints:")
@@ -229,19 +280,21 @@ def generate_report(results: List[Dict[str, Any]]) -> None:
         
         # Save the results to a JSON file
         output_file = os.path.join(os.path.dirname(__file__), "mcpo_endpoint_analysis.json")
-        with open(output_file, "w") as f:
-            json.dump({
-                "timestamp": datetime.now().isoformat(),
-                "summary": {
-                    "total_endpoints": total_endpoints,
-                    "successful_endpoints": successful_endpoints,
-                    "average_token_count": avg_token_count,
-                    "median_token_count": median_token_count,
-                    "min_token_count": min_token_count,
-                    "max_token_count": max_token_count
-                },
-                "endpoints": sorted_results
-            }, f, indent=2)
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "summary": {
+                "total_endpoints": total_endpoints,
+                "successful_endpoints": successful_endpoints,
+                "average_token_count": avg_token_count,
+                "median_token_count": median_token_count,
+                "min_token_count": min_token_count,
+                "max_token_count": max_token_count
+            },
+            "endpoints": sorted_results
+        }
+        # Serialize in one call and write the bytes in a single write
+        with open(output_file, "wb") as f:
+            f.write(dumps_pretty(report))
         
         print(f"\nDetailed results saved to: {output_file}")
     else:
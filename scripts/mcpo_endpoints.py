@@ -13,7 +13,9 @@ import os
 import sys
 import inspect
 import importlib
-from typing import Dict, List, Any, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 # Add the project root directory to the path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -24,18 +26,46 @@ from ergo_explorer.tools import contracts, tokenomics, ergowatch
 
 def get_module_functions(module) -> List[str]:
     """Get all public functions from a module."""
-    return [f for f in dir(module) if not f.startswith('_') and callable(getattr(module, f))]
+    # Read the module namespace directly rather than dir() + getattr per name
+    return sorted(name for name, value in vars(module).items()
+                  if not name.startswith('_') and callable(value))
 
-def analyze_functions(module, module_name: str) -> Dict[str, Any]:
-    """Analyze functions in a module and extract information."""
+@lru_cache(maxsize=None)
+def _module_source_file(module_name: Optional[str]) -> Optional[str]:
+    """Look up (once per module) the source file of an imported module."""
+    module = sys.modules.get(module_name) if module_name else None
+    if module is None:
+        return None
+    try:
+        return inspect.getsourcefile(module)
+    except TypeError:
+        return None
+
+def get_source_file(func) -> Optional[str]:
+    """Get the source file of a callable without re-walking the filesystem."""
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        return code.co_filename
+    # Classes and builtins have no code object; fall back to their module
+    return _module_source_file(getattr(func, "__module__", None))
+
+def analyze_functions(module, module_name: str) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Analyze functions in a module and extract information.
+    
+    Returns:
+        Tuple of (module info, feature words taken from the function names)
+    """
     functions = get_module_functions(module)
     
     function_info = []
+    feature_words = set()
     for func_name in functions:
+        feature_words.update(func_name.lower().split('_'))
         func = getattr(module, func_name)
         try:
             doc = func.__doc__ or "No documentation available"
-            source_file = inspect.getsourcefile(func)
+            source_file = get_source_file(func)
             if source_file:
                 source_file = os.path.basename(source_file)
             else:
@@ -59,11 +89,18 @@ def analyze_functions(module, module_name: str) -> Dict[str, Any]:
         "module": module_name,
         "functions": function_info,
         "function_count": len(function_info)
-    }
+    }, feature_words
 
 def get_unimplemented_features(prd_features: List[str], implemented: Set[str]) -> List[str]:
     """Compare PRD features with implemented features."""
-    return [feature for feature in prd_features if not any(impl in feature.lower() for impl in implemented)]
+    implemented = tuple(implemented)
+    unimplemented = []
+    for feature in prd_features:
+        # Lowercase each feature once rather than once per implemented word
+        feature_lower = feature.lower()
+        if not any(impl in feature_lower for impl in implemented):
+            unimplemented.append(feature)
+    return unimplemented
 
 def main():
     """Main function to analyze MCPO endpoints."""
@@ -82,18 +119,20 @@ def main():
     
     # Analyze modules
     results = {}
-    total_functions = 0
     implemented_features = set()
     
-    for module_name, module in modules.items():
-        module_info = analyze_functions(module, module_name)
+    # Introspect the modules concurrently; results come back in module order
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        analyses = list(executor.map(
+            lambda item: analyze_functions(item[1], item[0]), modules.items()
+        ))
+    
+    for module_name, (module_info, feature_words) in zip(modules, analyses):
         results[module_name] = module_info
-        total_functions += module_info["function_count"]
-        
-        # Add function names to implemented features
-        for func in module_info["functions"]:
-            name_parts = func["name"].lower().split('_')
-            implemented_features.update(name_parts)
+        # Function-name words count as implemented features
+        implemented_features |= feature_words
+    
+    total_functions = sum(module_info["function_count"] for module_info in results.values())
     
     # PRD features from Phase 2 and 3
     prd_phase2_features = [
@@ -66,31 +66,43 @@ async def test_historical_token_holders():
         }
     ]
     
-    # Run test cases
-    for case in test_cases:
+    url = f"{API_BASE_URL}/token/historical_token_holders"
+    
+    # Share one client (and its keep-alive pool) across all cases and send
+    # the independent requests concurrently
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.post(url, json=case["params"]) for case in test_cases),
+            return_exceptions=True
+        )
+    
+    # Report test cases in their original order
+    for case, response in zip(test_cases, responses):
         print(f"\n📝 Test: {case['name']}")
         print(f"Parameters: {json.dumps(case['params'], indent=2)}")
         
         try:
-            url = f"{API_BASE_URL}/token/historical_token_holders"
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=case["params"])
+            if isinstance(response, Exception):
+                raise response
+            
+            if response.status_code == 200:
+                result = response.json()
                 
-                if response.status_code == 200:
-                    result = response.json()
+                # Extract key metrics for a brief overview
+                if "status" in result and result["status"] == "success":
+                    transfers_count = len(result.get("recent_transfers", []))
+                    snapshots_count = len(result.get("distribution_changes", []))
+                    time_range = result.get("query", {}).get("time_range_readable", "unknown")
                     
-                    # Extract key metrics for a brief overview
-                    if "status" in result and result["status"] == "success":
-                        transfers_count = len(result.get("recent_transfers", []))
-                        snapshots_count = len(result.get("distribution_changes", []))
-                        time_range = result.get("query", {}).get("time_range_readable", "unknown")
-                        
-                        print(f"✅ Success: Found {transfers_count} transfers and {snapshots_count} snapshots")
-                        print(f"   Time Range: {time_range}")
-                    else:
-                        print(f"❌ API error: {result.get('error', 'Unknown error')}")
+                    print(f"✅ Success: Found {transfers_count} transfers and {snapshots_count} snapshots")
+                    print(f"   Time Range: {time_range}")
                 else:
-                    print(f"❌ HTTP error: {response.status_code} - {response.text}")
+                    print(f"❌ API error: {result.get('error', 'Unknown error')}")
+            else:
+                print(f"❌ HTTP error: {response.status_code} - {response.text}")
         
         except Exception as e:
             print(f"❌ Exception: {str(e)}")
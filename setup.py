@@ -19,7 +19,7 @@ setup(
     extras_require={
         "test": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.18.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=3.0.0",
             "pytest-mock>=3.7.0",
         ],
@@ -29,6 +29,9 @@ setup(
             "isort",
             "mypy",
         ],
+        "http2": [
+            "h2>=4.1.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -1,41 +1,31 @@
 """
 Test script for the address clustering and entity identification with Open WebUI integration.
+
+Set ERGO_MCP_WRITE_HTML=1 to save the generated visualization to entity_viz_test.html.
 """
 
 import asyncio
+import functools
 import logging
+import os
 import sys
+from pathlib import Path
 import json
-from pprint import pprint
-from mcp.server.fastmcp import Context, FastMCP
+from types import MappingProxyType
+from collections.abc import Mapping
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 logger = logging.getLogger()
-logger.addHandler(logging.StreamHandler(sys.stdout))
-
-# Import our routes module
-from ergo_explorer.api.routes.address_clustering import register_address_clustering_routes
-
-class TestMCP(FastMCP):
-    def __init__(self):
-        self.tools = {}
-        
-    def tool(self):
-        def wrapper(func):
-            name = func.__name__
-            self.tools[name] = func
-            return func
-        return wrapper
-    
-    async def call_tool(self, name, **kwargs):
-        if name not in self.tools:
-            raise ValueError(f"Tool {name} not found")
-        return await self.tools[name](Context(), **kwargs)
 
+@functools.lru_cache(maxsize=16)
 def mock_entity_data(address):
-    """Create mock entity data for testing when API is unavailable."""
-    return {
+    """Create mock entity data for testing when API is unavailable.
+
+    The result is cached per address and returned as a read-only mapping,
+    since callers only read from it.
+    """
+    return MappingProxyType({
         "address": address,
         "total_clusters": 3,
         "seed_cluster_id": 0,
@@ -75,17 +65,11 @@ def mock_entity_data(address):
         "analysis_depth": 1,
         "success": True,
         "error": None
-    }
+    })
 
 async def test_entity_identification():
     """Test the address clustering and entity identification tools."""
     
-    # Create our test MCP instance
-    mcp = TestMCP()
-    
-    # Register the address clustering routes
-    register_address_clustering_routes(mcp)
-    
     # Example Ergo address to analyze
     # This is a known active address from the Ergo blockchain
     test_address = "9iMWaVQbnKUxQei1yT9gVaP7TbVnRz9U68tXjZGZWXB8Wc3U3Md"
@@ -97,18 +81,19 @@ async def test_entity_identification():
         logger.info("Using mock data since the API is returning 500 errors")
         result = mock_entity_data(test_address)
         
-        # Print the entity detection results
-        logger.info("Entity cluster detection results:")
-        if isinstance(result, dict):
+        # Print the entity detection results as a single log record
+        lines = ["Entity cluster detection results:"]
+        if isinstance(result, Mapping):
             clusters = result.get("clusters", {})
             if isinstance(clusters, dict):
-                logger.info(f"Found {len(clusters)} potential clusters")
+                lines.append(f"Found {len(clusters)} potential clusters")
             else:
-                logger.info(f"Found {len(set(clusters.values()) if isinstance(clusters, dict) else 0)} potential clusters")
+                lines.append(f"Found {len(set(clusters.values()) if isinstance(clusters, dict) else 0)} potential clusters")
         else:
-            logger.info("No clusters found - result was not a dictionary")
+            lines.append("No clusters found - result was not a dictionary")
         
-        logger.info(f"Seed cluster ID: {result.get('seed_cluster_id')}")
+        lines.append(f"Seed cluster ID: {result.get('seed_cluster_id')}")
+        logger.info("\n".join(lines))
         
         # Process the mock data for visualization
         from ergo_explorer.visualization.entity_viz import process_entity_data_for_viz, generate_entity_viz_html
@@ -143,14 +128,15 @@ async def test_entity_identification():
         }
         
         # Print info about the visualization
-        logger.info("Visualization results:")
-        logger.info(f"HTML length: {len(viz_result.get('visualization_html', ''))}")
+        logger.info(f"Visualization results:\nHTML length: {len(viz_result.get('visualization_html', ''))}")
         
-        # Create a simple HTML file to validate the visualization
-        with open("entity_viz_test.html", "w") as f:
-            f.write(viz_result.get('visualization_html', ''))
-        
-        logger.info("Saved visualization to entity_viz_test.html")
+        # Only write the HTML file for manual inspection when asked to;
+        # otherwise just check that a non-trivial page was generated
+        if os.environ.get("ERGO_MCP_WRITE_HTML"):
+            Path("entity_viz_test.html").write_bytes(viz_result.get('visualization_html', '').encode("utf-8"))
+            logger.info("Saved visualization to entity_viz_test.html")
+        else:
+            assert len(viz_result.get('visualization_html', '')) > 1000, "Generated visualization HTML is unexpectedly small"
         
         return True
     
@@ -3,13 +3,14 @@ Test script for address interaction visualization.
 """
 
 import asyncio
-import json
 import os
+from pathlib import Path
 from ergo_explorer.tools.address import get_common_interactions
 from ergo_explorer.visualization.address_viz import (
     process_interaction_data_for_viz,
     generate_interaction_viz_html
 )
+from ergo_explorer.util.json_utils import dumps_pretty
 
 async def test_visualization():
     # Test address - Ergo Foundation
@@ -37,14 +38,13 @@ async def test_visualization():
     
     # Save the HTML file
     output_path = "address_interaction_viz.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    Path(output_path).write_bytes(html.encode("utf-8"))
     
     print(f"Visualization saved to {os.path.abspath(output_path)}")
     
     # Also save the raw data for reference
-    with open("address_interaction_data.json", "w") as f:
-        json.dump(interaction_data, f, indent=2)
+    with open("address_interaction_data.json", "wb") as f:
+        f.write(dumps_pretty(interaction_data))
     
     print("Test completed successfully!")
 
@@ -12,41 +12,40 @@ async def main():
     address = '9gUDVVx75KyZ783YLECKngb1wy8KVwEfk3byjdfjUyDVAELAPUN'
     ctx = Context()
     
-    print("Testing API with verbose=False...")
-    condensed_result = await blockchain_address_interactions(
-        ctx, 
-        address=address, 
-        limit=2, 
-        min_interactions=2, 
-        verbose=False
+    print("Testing API with verbose=False and verbose=True...")
+    condensed_result, verbose_result = await asyncio.gather(
+        *(
+            blockchain_address_interactions(
+                ctx, 
+                address=address, 
+                limit=2, 
+                min_interactions=2, 
+                verbose=verbose
+            )
+            for verbose in (False, True)
+        )
     )
     
-    print("Keys in API result for condensed version:")
-    print(list(condensed_result["result"].keys()))
-    print("\nNumber of interactions in condensed version:")
-    print(len(condensed_result["result"]["common_interactions"]))
-    print("\nKeys in the first interaction (condensed):")
-    print(list(condensed_result["result"]["common_interactions"][0].keys()))
+    # Build the report and write it once, so it stays in one piece when run
+    # alongside the other scripts by run_all_tests.py
+    lines = ["Keys in API result for condensed version:"]
+    lines.append(str(list(condensed_result["result"].keys())))
+    lines.append("\nNumber of interactions in condensed version:")
+    lines.append(str(len(condensed_result["result"]["common_interactions"])))
+    lines.append("\nKeys in the first interaction (condensed):")
+    lines.append(str(list(condensed_result["result"]["common_interactions"][0].keys())))
     
-    print("\n" + "-"*80 + "\n")
+    lines.append("\n" + "-"*80 + "\n")
     
-    print("Testing API with verbose=True...")
-    verbose_result = await blockchain_address_interactions(
-        ctx, 
-        address=address, 
-        limit=2, 
-        min_interactions=2, 
-        verbose=True
-    )
-    
-    print("Keys in API result for verbose version:")
-    print(list(verbose_result["result"].keys()))
-    print("\nNumber of interactions in verbose version:")
-    print(len(verbose_result["result"]["common_interactions"]))
-    print("\nKeys in the first interaction (verbose):")
-    print(list(verbose_result["result"]["common_interactions"][0].keys()))
+    lines.append("Keys in API result for verbose version:")
+    lines.append(str(list(verbose_result["result"].keys())))
+    lines.append("\nNumber of interactions in verbose version:")
+    lines.append(str(len(verbose_result["result"]["common_interactions"])))
+    lines.append("\nKeys in the first interaction (verbose):")
+    lines.append(str(list(verbose_result["result"]["common_interactions"][0].keys())))
     
-    print("\nTest completed successfully!")
+    lines.append("\nTest completed successfully!")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
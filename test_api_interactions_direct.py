@@ -11,43 +11,43 @@ from ergo_explorer.tools.address import get_common_interactions
 async def main():
     address = '9gUDVVx75KyZ783YLECKngb1wy8KVwEfk3byjdfjUyDVAELAPUN'
     
-    print("Testing with verbose=False...")
-    condensed_result = await get_common_interactions(
-        address=address, 
-        limit=2, 
-        min_interactions=2, 
-        verbose=False
+    print("Testing with verbose=False and verbose=True...")
+    condensed_result, verbose_result = await asyncio.gather(
+        *(
+            get_common_interactions(
+                address=address, 
+                limit=2, 
+                min_interactions=2, 
+                verbose=verbose
+            )
+            for verbose in (False, True)
+        )
     )
     
-    print("Keys in the result object:")
-    print(list(condensed_result.keys()))
-    print("\nNumber of interactions:")
-    print(len(condensed_result["common_interactions"]))
-    print("\nKeys in the first interaction (condensed):")
-    print(list(condensed_result["common_interactions"][0].keys()))
-    print("\nKeys in statistics (condensed):")
-    print(list(condensed_result["statistics"].keys()))
+    # Build the report and write it once, so it stays in one piece when run
+    # alongside the other scripts by run_all_tests.py
+    lines = ["Keys in the result object:"]
+    lines.append(str(list(condensed_result.keys())))
+    lines.append("\nNumber of interactions:")
+    lines.append(str(len(condensed_result["common_interactions"])))
+    lines.append("\nKeys in the first interaction (condensed):")
+    lines.append(str(list(condensed_result["common_interactions"][0].keys())))
+    lines.append("\nKeys in statistics (condensed):")
+    lines.append(str(list(condensed_result["statistics"].keys())))
     
-    print("\n" + "-"*80 + "\n")
+    lines.append("\n" + "-"*80 + "\n")
     
-    print("Testing with verbose=True...")
-    verbose_result = await get_common_interactions(
-        address=address, 
-        limit=2, 
-        min_interactions=2, 
-        verbose=True
-    )
-    
-    print("Keys in the result object:")
-    print(list(verbose_result.keys()))
-    print("\nNumber of interactions:")
-    print(len(verbose_result["common_interactions"]))
-    print("\nKeys in the first interaction (verbose):")
-    print(list(verbose_result["common_interactions"][0].keys()))
-    print("\nKeys in statistics (verbose):")
-    print(list(verbose_result["statistics"].keys()))
+    lines.append("Keys in the result object:")
+    lines.append(str(list(verbose_result.keys())))
+    lines.append("\nNumber of interactions:")
+    lines.append(str(len(verbose_result["common_interactions"])))
+    lines.append("\nKeys in the first interaction (verbose):")
+    lines.append(str(list(verbose_result["common_interactions"][0].keys())))
+    lines.append("\nKeys in statistics (verbose):")
+    lines.append(str(list(verbose_result["statistics"].keys())))
     
-    print("\nTest completed successfully!")
+    lines.append("\nTest completed successfully!")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
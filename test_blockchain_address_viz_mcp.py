@@ -4,9 +4,8 @@ Test script for the blockchain_address_interaction_viz MCP tool.
 
 import asyncio
 import logging
-import json
 import sys
-from mcp.server.fastmcp import Context, FastMCP
+from pathlib import Path
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -14,31 +13,12 @@ logger = logging.getLogger()
 
 # Import routes
 from ergo_explorer.api.routes.blockchain import register_blockchain_routes
-
-class TestMCP(FastMCP):
-    """Simple MCP implementation for testing."""
-    
-    def __init__(self):
-        self.tools = {}
-        
-    def tool(self, name=None):
-        def wrapper(func):
-            tool_name = name or func.__name__
-            self.tools[tool_name] = func
-            return func
-        return wrapper
-    
-    async def call_tool(self, name, **kwargs):
-        if name not in self.tools:
-            raise ValueError(f"Tool {name} not found")
-        return await self.tools[name](Context(), **kwargs)
+from tests._mcp_fixture import _build_mcp
+from ergo_explorer.util.json_utils import dumps_pretty
 
 async def test_address_viz():
-    # Create MCP instance
-    mcp = TestMCP()
-    
-    # Register routes
-    register_blockchain_routes(mcp)
+    # Get the MCP instance with routes registered
+    mcp = _build_mcp(register_blockchain_routes)
     
     # Test address
     address = '9gUDVVx75KyZ783YLECKngb1wy8KVwEfk3byjdfjUyDVAELAPUN'
@@ -55,8 +35,7 @@ async def test_address_viz():
     )
     
     # Save HTML output
-    with open("mcp_address_viz.html", "w") as f:
-        f.write(result_html["content"])
+    Path("mcp_address_viz.html").write_bytes(result_html["content"].encode("utf-8"))
     
     print(f"HTML visualization saved to mcp_address_viz.html")
     
@@ -70,8 +49,8 @@ async def test_address_viz():
     )
     
     # Save JSON output
-    with open("mcp_address_viz.json", "w") as f:
-        json.dump(result_json["data"], f, indent=2)
+    with open("mcp_address_viz.json", "wb") as f:
+        f.write(dumps_pretty(result_json["data"]))
     
     print(f"JSON visualization data saved to mcp_address_viz.json")
     
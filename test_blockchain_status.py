@@ -6,8 +6,8 @@ This script tests both markdown and JSON formats of the blockchain status endpoi
 """
 
 import asyncio
-import json
 from ergo_explorer.tools.blockchain import blockchain_status
+from ergo_explorer.util.json_utils import dumps_pretty
 
 async def test_blockchain_status():
     """Test the blockchain_status function with both formats."""
@@ -20,7 +20,7 @@ async def test_blockchain_status():
     # Test JSON format
     print("Testing blockchain_status with JSON format:")
     json_response = await blockchain_status(response_format="json")
-    print(json.dumps(json_response, indent=2))
+    print(dumps_pretty(json_response).decode())
 
 if __name__ == "__main__":
     asyncio.run(test_blockchain_status()) 
\ No newline at end of file
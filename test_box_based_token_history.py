@@ -7,8 +7,6 @@ which provides comprehensive information including block heights.
 """
 
 import asyncio
-import json
-from datetime import datetime
 import logging
 
 # Configure logging
@@ -20,13 +18,6 @@ logger = logging.getLogger("test_box_based_token_history")
 from ergo_explorer.tools.blockchain import get_historical_token_holder_data
 from ergo_explorer.tools.token_holders import track_token_transfers_by_boxes
 
-# Custom JSON encoder to handle datetime objects
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-
 # Test tokens (known Ergo tokens)
 TEST_TOKENS = [
     "d71693c49a84fbbecd4908c94813b46514b18b67a99952dc1e6e4791556de413",  # ergopad
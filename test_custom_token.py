@@ -6,10 +6,7 @@ This script tests the box-based method for tracking historical token holders,
 which provides comprehensive information including block heights.
 """
 
-import asyncio
-import json
 import sys
-from datetime import datetime
 import logging
 
 # Configure logging
@@ -20,13 +17,8 @@ logger = logging.getLogger("test_custom_token")
 # Import necessary functions
 from ergo_explorer.tools.blockchain import get_historical_token_holder_data
 from ergo_explorer.tools.token_holders import track_token_transfers_by_boxes
-
-# Custom JSON encoder to handle datetime objects
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+from ergo_explorer.http_session import shared_client
+from ergo_explorer.util.event_loop import run_async
 
 async def test_box_based_tracking(token_id):
     """Test box-based historical token holder tracking"""
@@ -91,11 +83,13 @@ async def run_tests(token_id):
     """Run all tests"""
     logger.info(f"Starting box-based token history tests for token: {token_id}")
     
-    # Test box-based tracking
-    await test_box_based_tracking(token_id)
-    
-    # Test the API function
-    await test_historical_token_holder_data(token_id)
+    # Both tests reuse one keep-alive HTTP client, closed when they finish
+    async with shared_client():
+        # Test box-based tracking
+        await test_box_based_tracking(token_id)
+        
+        # Test the API function
+        await test_historical_token_holder_data(token_id)
     
     logger.info("All tests completed")
 
@@ -105,4 +99,4 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         token_id = sys.argv[1]
     
-    asyncio.run(run_tests(token_id)) 
\ No newline at end of file
+    run_async(run_tests(token_id)) 
\ No newline at end of file
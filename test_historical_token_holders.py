@@ -6,27 +6,14 @@ This script tests both time-based and transaction-based methods for tracking
 historical token holders with various parameter combinations.
 """
 
-import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
-import json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("test_historical_token_holders")
 
-# Custom JSON encoder to handle datetime objects
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-
-# No need to monkey patch json.dumps
-# original_dumps = json.dumps
-# json.dumps = lambda obj, **kwargs: original_dumps(obj, cls=CustomJSONEncoder, **kwargs)
-
 # Import necessary functions
 from ergo_explorer.tools.blockchain import get_historical_token_holder_data
 from ergo_explorer.tools.token_holders import (
@@ -36,6 +23,9 @@ from ergo_explorer.tools.token_holders import (
     PERIOD_WEEKLY,
     PERIOD_MONTHLY
 )
+from ergo_explorer.http_session import shared_client
+from ergo_explorer.util.event_loop import run_async
+from ergo_explorer.util.json_utils import dumps_pretty
 
 # Example token IDs to test with 
 # (using some known tokens from Ergo blockchain; replace with real tokens if needed)
@@ -121,6 +111,8 @@ async def test_time_range_parameter(token_id):
     
     results = {}
     
+    # The calls run one at a time: each one updates the token's shared
+    # TokenHistory and its cache file, which concurrent calls would race on
     for time_range in time_ranges:
         logger.info(f"Testing time_range: {time_range}")
         try:
@@ -149,7 +141,7 @@ async def test_time_range_parameter(token_id):
     
     # Print results
     logger.info("Time Range Parameter Test Results:")
-    print(json.dumps(results, indent=2, cls=CustomJSONEncoder))
+    print(dumps_pretty(results).decode())
     return results
 
 async def run_tests():
@@ -159,14 +151,17 @@ async def run_tests():
     
     logger.info(f"Running comprehensive tests for token {token_id}")
     
-    # Test time-based tracking
-    time_based_result = await test_time_based_tracking(token_id)
-    
-    # Test transaction-based tracking
-    tx_based_result = await test_transaction_based_tracking(token_id)
-    
-    # Test time_range parameter
-    time_range_results = await test_time_range_parameter(token_id)
+    # The tests all update this token's history, so they run one after
+    # another; they share one keep-alive HTTP client, closed once they finish
+    async with shared_client():
+        # Test time-based tracking
+        time_based_result = await test_time_based_tracking(token_id)
+        
+        # Test transaction-based tracking
+        tx_based_result = await test_transaction_based_tracking(token_id)
+        
+        # Test time_range parameter
+        time_range_results = await test_time_range_parameter(token_id)
     
     # Print summary
     logger.info("\n===== TEST SUMMARY =====")
@@ -196,4 +191,4 @@ async def run_tests():
 
 if __name__ == "__main__":
     # Run the async test
-    asyncio.run(run_tests()) 
\ No newline at end of file
+    run_async(run_tests()) 
\ No newline at end of file
@@ -19,12 +19,12 @@ async def main():
         
         # Pretty print the result
         # Convert to dictionary first if it's a custom object
-        if hasattr(result, 'to_dict'):
-            result_dict = result.to_dict()
-        else:
-            result_dict = result
-            
-        print(json.dumps(result_dict, indent=2, default=str))
+        to_dict = getattr(result, 'to_dict', None)
+        result_dict = to_dict() if to_dict is not None else result
+        
+        # Stream the JSON to stdout instead of building the whole string first
+        json.dump(result_dict, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
         
     except Exception as e:
         print(f"Error: {e}")
@@ -1,11 +1,13 @@
 import pytest
+import pytest_asyncio
 import logging
 import sys
 import os
-import json
-from datetime import datetime
+import time
+from pathlib import Path
 from unittest.mock import AsyncMock
 from dotenv import load_dotenv
+from ergo_explorer.util.json_utils import dumps_pretty
 
 # Load environment variables from .env.test file
 dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env.test')
@@ -15,6 +17,10 @@ local_dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.e
 if os.path.exists(local_dotenv_path):
     load_dotenv(local_dotenv_path, override=True)
 
+# Log formatters, built once and shared by every setup_logging() call
+_CONSOLE_FORMATTER = logging.Formatter('%(levelname)s [%(name)s] %(message)s')
+_FILE_FORMATTER = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
+
 # Configure logging
 def setup_logging():
     """Set up logging for tests with both console and file output."""
@@ -22,10 +28,10 @@ def setup_logging():
     logging_level = os.environ.get('TEST_LOG_LEVEL', 'INFO')
     numeric_level = getattr(logging, logging_level.upper(), logging.INFO)
     
-    # Create logs directory if needed
+    # Create logs directory if needed (a bare file name has parent ".", which exists)
     log_file = os.environ.get('TEST_LOG_FILE')
     if log_file:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     
     # Set up root logger
     root_logger = logging.getLogger()
@@ -35,28 +41,24 @@ def setup_logging():
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # Create formatters
-    console_formatter = logging.Formatter('%(levelname)s [%(name)s] %(message)s')
-    file_formatter = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
-    
     # Add console handler
     console = logging.StreamHandler()
     console.setLevel(numeric_level)
-    console.setFormatter(console_formatter)
+    console.setFormatter(_CONSOLE_FORMATTER)
     root_logger.addHandler(console)
     
     # Add file handler if configured
     if log_file:
         # Generate a timestamp for a unique session log
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         log_file_with_timestamp = log_file.replace('.log', f'_{timestamp}.log')
         
         file_handler = logging.FileHandler(log_file_with_timestamp)
         file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(_FILE_FORMATTER)
         root_logger.addHandler(file_handler)
         
-        logging.info(f"Logging to file: {log_file_with_timestamp}")
+        logging.info("Logging to file: %s", log_file_with_timestamp)
     
     # Configure specific modules to appropriate log levels
     logging.getLogger('httpx').setLevel(logging.WARNING)  # Reduce httpx noise
@@ -66,8 +68,8 @@ def setup_logging():
 # Set up logging
 logger = setup_logging()
 logger.info("==== Starting Ergo Explorer MCP Integration Tests ====")
-logger.info(f"Test configuration: API Timeout: {os.environ.get('API_TIMEOUT')}, "
-           f"Log level: {os.environ.get('TEST_LOG_LEVEL')}")
+logger.info("Test configuration: API Timeout: %s, Log level: %s",
+            os.environ.get('API_TIMEOUT'), os.environ.get('TEST_LOG_LEVEL'))
 
 # Add the parent directory to sys.path to import the client module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -78,17 +80,29 @@ TEST_TOKEN_SIGUSD = os.environ.get('TEST_TOKEN_SIGUSD', '03faf2cb329f2e90d6d23b5
 TEST_TRANSACTION_ID = os.environ.get('TEST_TRANSACTION_ID', '9148408c04c2e38a6402a7950d6157730fa7d49e9ab3b9cadec481d7769918e9')
 API_TIMEOUT = float(os.environ.get('API_TIMEOUT', '30.0'))
 SKIP_RATE_LIMITED = os.environ.get('SKIP_RATE_LIMITED_TESTS', 'false').lower() == 'true'
+# Response keys checked by the live tests
+_HOLDER_SECTIONS = frozenset(('token', 'holders', 'analysis', 'summary'))
+_STATUS_FIELDS = frozenset(('height', 'lastBlockId'))
+_TRANSACTION_FIELDS = frozenset(('id', 'blockId', 'timestamp'))
+_BLOCK_FIELDS = frozenset(('height', 'id', 'timestamp'))
+
+# Per-test skip flags (SKIP_TEST_<NAME>=true), read once after the .env files are loaded
+_SKIP_TESTS = {
+    key[len('SKIP_TEST_'):]: value.lower() == 'true'
+    for key, value in os.environ.items()
+    if key.startswith('SKIP_TEST_')
+}
 
 def pretty_format(obj):
     """Format object for nicer display in logs."""
     try:
-        return json.dumps(obj, indent=2, sort_keys=True)
+        return dumps_pretty(obj, sort_keys=True).decode()
     except:
         return str(obj)
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def ergo_client():
-    """Fixture that provides an ErgoClient instance for tests."""
+    """Fixture that provides one ErgoClient, and its pooled connections, for every test."""
     try:
         # Pass any configuration from environment variables
         client = ErgoClient(
@@ -97,14 +111,14 @@ async def ergo_client():
             timeout=API_TIMEOUT
         )
         logger.info("Created ErgoClient instance for testing")
-        yield client
     except Exception as e:
-        logger.error(f"Failed to create ErgoClient: {str(e)}")
+        logger.error("Failed to create ErgoClient: %s", e)
         # Return a mock instead to allow tests to run but likely fail
-        mock_client = AsyncMock()
-        yield mock_client
+        client = AsyncMock()
+    yield client
+    await client.aclose()
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_live_get_token_holders(ergo_client):
     """Test get_token_holders with live data."""
     logger.info("\n" + "="*80)
@@ -113,7 +127,7 @@ async def test_live_get_token_holders(ergo_client):
     
     # Use token ID from environment variable
     token_id = TEST_TOKEN_SIGUSD
-    logger.info(f"Fetching holders for token ID: {token_id}")
+    logger.info("Fetching holders for token ID: %s", token_id)
     
     if SKIP_RATE_LIMITED:
         logger.info("Skipping rate-limited test: get_token_holders")
@@ -126,45 +140,40 @@ async def test_live_get_token_holders(ergo_client):
         # Token holders may return different formats
         if isinstance(result, dict):
             # Check for expected structure in the dictionary response
-            expected_sections = ['token', 'holders', 'analysis', 'summary']
-            has_section = False
-            for section in expected_sections:
-                if section in result:
-                    has_section = True
-                    break
-            assert has_section, f"Holders response missing expected sections: {result.keys()}"
+            assert _HOLDER_SECTIONS & result.keys(), f"Holders response missing expected sections: {result.keys()}"
             
             # Log token info
             if 'token' in result:
                 token_info = result['token']
-                logger.info(f"Token info: name={token_info.get('name', 'N/A')}, "
-                           f"ID={token_info.get('id', 'N/A')}, "
-                           f"decimals={token_info.get('decimals', 'N/A')}")
+                logger.info("Token info: name=%s, ID=%s, decimals=%s",
+                            token_info.get('name', 'N/A'),
+                            token_info.get('id', 'N/A'),
+                            token_info.get('decimals', 'N/A'))
             
             # Log holder count
             if 'holders' in result:
                 holders = result['holders']
-                logger.info(f"Found {len(holders)} holders for token")
+                logger.info("Found %s holders for token", len(holders))
                 if len(holders) > 0:
-                    logger.info(f"Top holder: {holders[0]}")
+                    logger.info("Top holder: %s", holders[0])
             
-            logger.info(f"Found token holders data with keys: {result.keys()}")
+            logger.info("Found token holders data with keys: %s", result.keys())
             
         elif isinstance(result, str):
             # If result is a string, it should contain holder information
             assert "holder" in result.lower() or "distribution" in result.lower(), \
                 f"String result doesn't appear to contain holder information: {result[:100]}..."
-            logger.info(f"Token holders returned text: {result[:100]}...")
+            logger.info("Token holders returned text: %s...", result[:100])
             
         else:
             assert False, f"Unexpected result type: {type(result)}"
         
         logger.info("Token holders test completed successfully")
     except Exception as e:
-        logger.error(f"Error fetching token holders: {str(e)}")
+        logger.error("Error fetching token holders: %s", e)
         pytest.skip(f"Token holders test failed: {str(e)}")
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_live_blockchain_status(ergo_client):
     """Test blockchain_status with live data."""
     logger.info("\n" + "="*80)
@@ -180,19 +189,18 @@ async def test_live_blockchain_status(ergo_client):
         if isinstance(result, dict):
             # The Explorer API actually returns different fields than we expected
             # Check for essential blockchain data fields instead
-            expected_fields = ['height', 'lastBlockId']
-            for field in expected_fields:
-                assert field in result, f"Missing field '{field}' in blockchain status"
+            missing = _STATUS_FIELDS - result.keys()
+            assert not missing, f"Missing fields {sorted(missing)} in blockchain status"
             
             # Log some useful information
-            logger.info(f"Blockchain status: height={result.get('height')}, " 
-                        f"last block={result.get('lastBlockId')}")
+            logger.info("Blockchain status: height=%s, last block=%s",
+                        result.get('height'), result.get('lastBlockId'))
             
             # Additional info if available
             if 'supply' in result:
-                logger.info(f"Circulating supply: {result.get('supply')}")
+                logger.info("Circulating supply: %s", result.get('supply'))
             if 'transactionAverage' in result:
-                logger.info(f"Transaction average: {result.get('transactionAverage')}")
+                logger.info("Transaction average: %s", result.get('transactionAverage'))
             
             # Check that height is a positive integer
             assert isinstance(result.get('height'), int), "Height is not an integer"
@@ -200,16 +208,16 @@ async def test_live_blockchain_status(ergo_client):
             
         elif isinstance(result, str):
             assert "height" in result.lower(), f"String result doesn't contain height information"
-            logger.info(f"Blockchain status text: {result[:100]}...")
+            logger.info("Blockchain status text: %s...", result[:100])
         else:
             assert False, f"Unexpected result type: {type(result)}"
         
         logger.info("Blockchain status test completed successfully")
     except Exception as e:
-        logger.error(f"Error fetching blockchain status: {str(e)}")
+        logger.error("Error fetching blockchain status: %s", e)
         pytest.skip(f"Blockchain status test failed: {str(e)}")
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_live_get_transaction(ergo_client):
     """Test get_transaction with live data."""
     logger.info("\n" + "="*80)
@@ -218,7 +226,7 @@ async def test_live_get_transaction(ergo_client):
     
     # Use transaction ID from environment variable
     tx_id = TEST_TRANSACTION_ID
-    logger.info(f"Fetching transaction: {tx_id}")
+    logger.info("Fetching transaction: %s", tx_id)
     
     try:
         result = await ergo_client.get_transaction(tx_id)
@@ -226,38 +234,37 @@ async def test_live_get_transaction(ergo_client):
         
         if isinstance(result, dict):
             # Verify key transaction fields
-            expected_fields = ['id', 'blockId', 'timestamp']
-            for field in expected_fields:
-                assert field in result, f"Missing field '{field}' in transaction"
+            missing = _TRANSACTION_FIELDS - result.keys()
+            assert not missing, f"Missing fields {sorted(missing)} in transaction"
             assert result.get('id') == tx_id, f"Transaction ID mismatch: {result.get('id')} != {tx_id}"
             
             # Log transaction details
-            logger.info(f"Found transaction: {tx_id}")
-            logger.info(f"Block ID: {result.get('blockId')}")
-            logger.info(f"Timestamp: {result.get('timestamp')}")
+            logger.info("Found transaction: %s", tx_id)
+            logger.info("Block ID: %s", result.get('blockId'))
+            logger.info("Timestamp: %s", result.get('timestamp'))
             
             # Log inputs and outputs if available
             if 'inputs' in result:
-                logger.info(f"Number of inputs: {len(result.get('inputs', []))}")
+                logger.info("Number of inputs: %s", len(result.get('inputs', [])))
             if 'outputs' in result:
-                logger.info(f"Number of outputs: {len(result.get('outputs', []))}")
+                logger.info("Number of outputs: %s", len(result.get('outputs', [])))
                 
             # Log size if available
             if 'size' in result:
-                logger.info(f"Transaction size: {result.get('size')} bytes")
+                logger.info("Transaction size: %s bytes", result.get('size'))
                 
         elif isinstance(result, str):
             assert tx_id in result, f"Transaction ID not found in text result"
-            logger.info(f"Transaction returned as text: {result[:100]}...")
+            logger.info("Transaction returned as text: %s...", result[:100])
         else:
             assert False, f"Unexpected result type: {type(result)}"
         
         logger.info("Transaction test completed successfully")
     except Exception as e:
-        logger.error(f"Error fetching transaction: {str(e)}")
+        logger.error("Error fetching transaction: %s", e)
         pytest.skip(f"Transaction test failed: {str(e)}")
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_live_search_token(ergo_client):
     """Test search_token with live data."""
     logger.info("\n" + "="*80)
@@ -265,7 +272,7 @@ async def test_live_search_token(ergo_client):
     logger.info("="*80)
     
     query = "SigUSD"
-    logger.info(f"Searching for token: {query}")
+    logger.info("Searching for token: %s", query)
     
     try:
         result = await ergo_client.search_token(query)
@@ -273,36 +280,36 @@ async def test_live_search_token(ergo_client):
         
         if isinstance(result, list):
             assert len(result) > 0, f"No tokens found for query: {query}"
-            logger.info(f"Found {len(result)} tokens for query: {query}")
+            logger.info("Found %s tokens for query: %s", len(result), query)
             
             # Log top token details
             if len(result) > 0:
                 top_token = result[0]
-                logger.info(f"Top token: {pretty_format(top_token)}")
+                logger.info("Top token: %s", pretty_format(top_token))
             
         elif isinstance(result, dict):
             assert 'items' in result or 'tokens' in result, f"Missing 'items' or 'tokens' in token search result"
             items = result.get('items', result.get('tokens', []))
             assert len(items) > 0, f"No tokens found for query: {query}"
-            logger.info(f"Found {len(items)} tokens for query: {query}")
+            logger.info("Found %s tokens for query: %s", len(items), query)
             
             # Log top token details
             if len(items) > 0:
                 top_token = items[0]
-                logger.info(f"Top token: {pretty_format(top_token)}")
+                logger.info("Top token: %s", pretty_format(top_token))
                 
         elif isinstance(result, str):
             assert query.lower() in result.lower(), f"Query not found in text result"
-            logger.info(f"Token search returned text: {result[:100]}...")
+            logger.info("Token search returned text: %s...", result[:100])
         else:
             assert False, f"Unexpected result type: {type(result)}"
         
         logger.info("Token search test completed successfully")
     except Exception as e:
-        logger.error(f"Error searching for token: {str(e)}")
+        logger.error("Error searching for token: %s", e)
         pytest.skip(f"Token search test failed: {str(e)}")
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_live_get_latest_blocks(ergo_client):
     """Test get_latest_blocks with live data."""
     logger.info("\n" + "="*80)
@@ -310,7 +317,7 @@ async def test_live_get_latest_blocks(ergo_client):
     logger.info("="*80)
     
     limit = 5
-    logger.info(f"Fetching {limit} latest blocks")
+    logger.info("Fetching %s latest blocks", limit)
     
     try:
         result = await ergo_client.get_latest_blocks(limit)
@@ -319,49 +326,47 @@ async def test_live_get_latest_blocks(ergo_client):
         if isinstance(result, list):
             assert len(result) > 0, "No blocks returned"
             assert len(result) <= limit, f"Too many blocks returned: {len(result)} > {limit}"
-            logger.info(f"Found {len(result)} latest blocks")
+            logger.info("Found %s latest blocks", len(result))
             
             # Check first block has basic properties and log details
             if len(result) > 0 and isinstance(result[0], dict):
-                required_fields = ['height', 'id', 'timestamp']
-                for field in required_fields:
-                    assert field in result[0], f"Missing field '{field}' in block"
+                missing = _BLOCK_FIELDS - result[0].keys()
+                assert not missing, f"Missing fields {sorted(missing)} in block"
                 
                 # Log latest block details
                 latest = result[0]
-                logger.info(f"Latest block: height={latest.get('height')}, "
-                           f"id={latest.get('id')}, "
-                           f"timestamp={latest.get('timestamp')}")
+                logger.info("Latest block: height=%s, id=%s, timestamp=%s",
+                            latest.get('height'), latest.get('id'), latest.get('timestamp'))
                 
                 # Log transactions count if available
                 if 'transactionsCount' in latest:
-                    logger.info(f"Transaction count: {latest.get('transactionsCount')}")
+                    logger.info("Transaction count: %s", latest.get('transactionsCount'))
                     
                 # Log mining time if available
                 if 'miningTime' in latest:
-                    logger.info(f"Mining time: {latest.get('miningTime')} ms")
+                    logger.info("Mining time: %s ms", latest.get('miningTime'))
                 
         elif isinstance(result, dict):
             assert 'items' in result or 'blocks' in result, f"Missing 'items' or 'blocks' in blocks result"
             items = result.get('items', result.get('blocks', []))
             assert len(items) > 0, "No blocks found"
-            logger.info(f"Found {len(items)} latest blocks")
+            logger.info("Found %s latest blocks", len(items))
             
             # Log latest block details
             if len(items) > 0:
                 latest = items[0]
-                logger.info(f"Latest block: {pretty_format(latest)}")
+                logger.info("Latest block: %s", pretty_format(latest))
                 
         elif isinstance(result, str):
             assert "block" in result.lower() or "height" in result.lower(), \
                 f"Result doesn't appear to contain block information"
-            logger.info(f"Latest blocks returned as text: {result[:100]}...")
+            logger.info("Latest blocks returned as text: %s...", result[:100])
         else:
             assert False, f"Unexpected result type: {type(result)}"
         
         logger.info("Latest blocks test completed successfully")
     except Exception as e:
-        logger.error(f"Error fetching latest blocks: {str(e)}")
+        logger.error("Error fetching latest blocks: %s", e)
         pytest.skip(f"Latest blocks test failed: {str(e)}")
 
 # Add a helper method to skip tests based on environment variable
@@ -370,5 +375,4 @@ def should_skip(test_name):
     if SKIP_RATE_LIMITED:
         return True
     # Could add more specific test skip flags here
-    specific_skip = os.environ.get(f"SKIP_TEST_{test_name.upper()}", "false").lower() == "true"
-    return specific_skip
\ No newline at end of file
+    return _SKIP_TESTS.get(test_name.upper(), False)
\ No newline at end of file
@@ -8,6 +8,7 @@ markdown-formatted responses to structured JSON data.
 
 import asyncio
 import json
+import re
 import sys
 from typing import Dict, Any
 
@@ -16,155 +17,158 @@ from ergo_explorer.tools.blockchain import get_blockchain_height, get_transactio
 from ergo_explorer.tools.eip_manager import list_eips
 from ergo_explorer.response_standardizer import convert_markdown_to_json
 
+RESULTS_FILE = "standardizer_test_results.jsonl"
+
+# Height fields in the blockchain height markdown, matched in one pass
+_HEIGHT_FIELD_RE = re.compile(r"(Indexed Height|Full Height|Blocks Behind): ([0-9,]+)")
+_HEIGHT_FIELD_KEYS = {
+    "Indexed Height": "indexed_height",
+    "Full Height": "full_height",
+    "Blocks Behind": "blocks_behind"
+}
+
 async def test_standardizer():
     """Test the response standardizer with real endpoints."""
-    results = []
-    
-    # Test address balance standardization
-    address = "9hHDQb26AjnJUXxcqriqY1mnhpLuUeC81C4pggtK7tupr92Ea1K"
-    print(f"Testing address balance for {address}...")
-    
-    try:
-        # Get original markdown-formatted balance
-        balance_md = await get_address_balance(address)
-        print("Original balance response:")
-        print(balance_md)
-        print("\n")
-        
-        # Convert to structured JSON
-        balance_json = convert_markdown_to_json(balance_md, "balance")
-        print("Structured JSON balance:")
-        print(json.dumps(balance_json, indent=2))
-        print("\n")
+    # Each result is written as one JSON line as soon as its test finishes,
+    # so partial results survive a failed run
+    with open(RESULTS_FILE, "w") as results_file:
+        def write_result(entry: Dict[str, Any]):
+            results_file.write(json.dumps(entry) + "\n")
+            results_file.flush()
+            
+        # Test address balance standardization
+        address = "9hHDQb26AjnJUXxcqriqY1mnhpLuUeC81C4pggtK7tupr92Ea1K"
+        print(f"Testing address balance for {address}...")
         
-        results.append({
-            "test": "address_balance",
-            "markdown": balance_md,
-            "json": balance_json
-        })
-    except Exception as e:
-        print(f"Error testing address balance: {str(e)}")
-    
-    # Test transaction history standardization
-    print(f"Testing transaction history for {address}...")
-    
-    try:
-        # Get original markdown-formatted transaction history
-        tx_history_md = await get_transaction_history(address, limit=2)
-        print("Original transaction history response:")
-        print(tx_history_md)
-        print("\n")
+        try:
+            # Get original markdown-formatted balance
+            balance_md = await get_address_balance(address)
+            print("Original balance response:")
+            print(balance_md)
+            print("\n")
+            
+            # Convert to structured JSON
+            balance_json = convert_markdown_to_json(balance_md, "balance")
+            print("Structured JSON balance:")
+            print(json.dumps(balance_json, indent=2))
+            print("\n")
+            
+            write_result({
+                "test": "address_balance",
+                "markdown": balance_md,
+                "json": balance_json
+            })
+        except Exception as e:
+            print(f"Error testing address balance: {str(e)}")
         
-        # For transaction history, we'd need to implement a custom parser
-        # This is just a placeholder for demonstration
-        results.append({
-            "test": "transaction_history",
-            "markdown": tx_history_md,
-            "json": {"status": "not_implemented"}
-        })
-    except Exception as e:
-        print(f"Error testing transaction history: {str(e)}")
-    
-    # Test blockchain height standardization
-    print("Testing blockchain height...")
-    
-    try:
-        # Get original markdown-formatted blockchain height
-        height_md = await get_blockchain_height()
-        print("Original blockchain height response:")
-        print(height_md)
-        print("\n")
+        # Test transaction history standardization
+        print(f"Testing transaction history for {address}...")
         
-        # Create custom structured data for blockchain height
-        height_json = {
-            "blockchain_height": {
-                "indexed_height": None,
-                "full_height": None,
-                "blocks_behind": None
-            }
-        }
+        try:
+            # Get original markdown-formatted transaction history
+            tx_history_md = await get_transaction_history(address, limit=2)
+            print("Original transaction history response:")
+            print(tx_history_md)
+            print("\n")
+            
+            # For transaction history, we'd need to implement a custom parser
+            # This is just a placeholder for demonstration
+            write_result({
+                "test": "transaction_history",
+                "markdown": tx_history_md,
+                "json": {"status": "not_implemented"}
+            })
+        except Exception as e:
+            print(f"Error testing transaction history: {str(e)}")
         
-        # Extract height information using regex
-        import re
+        # Test blockchain height standardization
+        print("Testing blockchain height...")
         
-        indexed_match = re.search(r"Indexed Height: ([0-9,]+)", height_md)
-        if indexed_match:
-            height_json["blockchain_height"]["indexed_height"] = int(indexed_match.group(1).replace(",", ""))
+        try:
+            # Get original markdown-formatted blockchain height
+            height_md = await get_blockchain_height()
+            print("Original blockchain height response:")
+            print(height_md)
+            print("\n")
             
-        full_match = re.search(r"Full Height: ([0-9,]+)", height_md)
-        if full_match:
-            height_json["blockchain_height"]["full_height"] = int(full_match.group(1).replace(",", ""))
+            # Create custom structured data for blockchain height
+            height_json = {
+                "blockchain_height": {
+                    "indexed_height": None,
+                    "full_height": None,
+                    "blocks_behind": None
+                }
+            }
             
-        behind_match = re.search(r"Blocks Behind: ([0-9,]+)", height_md)
-        if behind_match:
-            height_json["blockchain_height"]["blocks_behind"] = int(behind_match.group(1).replace(",", ""))
-        
-        print("Structured JSON blockchain height:")
-        print(json.dumps(height_json, indent=2))
-        print("\n")
-        
-        results.append({
-            "test": "blockchain_height",
-            "markdown": height_md,
-            "json": height_json
-        })
-    except Exception as e:
-        print(f"Error testing blockchain height: {str(e)}")
-    
-    # Test transaction info standardization
-    tx_id = "ff9b418e98074562f337d3ece5bfabbe78c3e7f38c6536cc382827caf15c6890"
-    print(f"Testing transaction info for {tx_id}...")
-    
-    try:
-        # Get original markdown-formatted transaction info
-        tx_info_md = await get_transaction_info(tx_id)
-        print("Original transaction info response:")
-        print(tx_info_md[:500] + "..." if len(tx_info_md) > 500 else tx_info_md)
-        print("\n")
+            # Extract height information with one scan, keeping the first match of each field
+            height_fields = height_json["blockchain_height"]
+            for match in _HEIGHT_FIELD_RE.finditer(height_md):
+                key = _HEIGHT_FIELD_KEYS[match.group(1)]
+                if height_fields[key] is None:
+                    height_fields[key] = int(match.group(2).replace(",", ""))
+            
+            print("Structured JSON blockchain height:")
+            print(json.dumps(height_json, indent=2))
+            print("\n")
+            
+            write_result({
+                "test": "blockchain_height",
+                "markdown": height_md,
+                "json": height_json
+            })
+        except Exception as e:
+            print(f"Error testing blockchain height: {str(e)}")
         
-        # Convert to structured JSON
-        tx_info_json = convert_markdown_to_json(tx_info_md, "transaction")
-        print("Structured JSON transaction info:")
-        print(json.dumps(tx_info_json, indent=2))
-        print("\n")
+        # Test transaction info standardization
+        tx_id = "ff9b418e98074562f337d3ece5bfabbe78c3e7f38c6536cc382827caf15c6890"
+        print(f"Testing transaction info for {tx_id}...")
         
-        results.append({
-            "test": "transaction_info",
-            "markdown": tx_info_md,
-            "json": tx_info_json
-        })
-    except Exception as e:
-        print(f"Error testing transaction info: {str(e)}")
-    
-    # Test EIP list standardization
-    print("Testing EIP list...")
-    
-    try:
-        # Get original markdown-formatted EIP list
-        eip_list_md = await list_eips()
-        print("Original EIP list response:")
-        print(eip_list_md[:500] + "..." if len(eip_list_md) > 500 else eip_list_md)
-        print("\n")
+        try:
+            # Get original markdown-formatted transaction info
+            tx_info_md = await get_transaction_info(tx_id)
+            print("Original transaction info response:")
+            print(tx_info_md[:500] + "..." if len(tx_info_md) > 500 else tx_info_md)
+            print("\n")
+            
+            # Convert to structured JSON
+            tx_info_json = convert_markdown_to_json(tx_info_md, "transaction")
+            print("Structured JSON transaction info:")
+            print(json.dumps(tx_info_json, indent=2))
+            print("\n")
+            
+            write_result({
+                "test": "transaction_info",
+                "markdown": tx_info_md,
+                "json": tx_info_json
+            })
+        except Exception as e:
+            print(f"Error testing transaction info: {str(e)}")
         
-        # Convert to structured JSON
-        eip_list_json = convert_markdown_to_json(eip_list_md, "eip")
-        print("Structured JSON EIP list:")
-        print(json.dumps(eip_list_json, indent=2))
-        print("\n")
+        # Test EIP list standardization
+        print("Testing EIP list...")
         
-        results.append({
-            "test": "eip_list",
-            "markdown": eip_list_md,
-            "json": eip_list_json
-        })
-    except Exception as e:
-        print(f"Error testing EIP list: {str(e)}")
-    
-    # Write test results to file
-    with open("standardizer_test_results.json", "w") as f:
-        json.dump(results, f, indent=2)
+        try:
+            # Get original markdown-formatted EIP list
+            eip_list_md = await list_eips()
+            print("Original EIP list response:")
+            print(eip_list_md[:500] + "..." if len(eip_list_md) > 500 else eip_list_md)
+            print("\n")
+            
+            # Convert to structured JSON
+            eip_list_json = convert_markdown_to_json(eip_list_md, "eip")
+            print("Structured JSON EIP list:")
+            print(json.dumps(eip_list_json, indent=2))
+            print("\n")
+            
+            write_result({
+                "test": "eip_list",
+                "markdown": eip_list_md,
+                "json": eip_list_json
+            })
+        except Exception as e:
+            print(f"Error testing EIP list: {str(e)}")
     
-    print("Test results written to standardizer_test_results.json")
+    print(f"Test results written to {RESULTS_FILE}")
 
 if __name__ == "__main__":
     asyncio.run(test_standardizer()) 
\ No newline at end of file
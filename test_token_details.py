@@ -7,6 +7,7 @@ including block heights and detailed holder snapshots.
 """
 
 import asyncio
+import heapq
 import json
 import sys
 from datetime import datetime
@@ -28,6 +29,11 @@ class CustomJSONEncoder(json.JSONEncoder):
             return obj.isoformat()
         return super().default(obj)
 
+def _holder_amount(item):
+    """Sort key for a snapshot (address, amount) pair."""
+    amount = item[1]
+    return int(amount) if isinstance(amount, (int, str)) else 0
+
 async def display_token_details(token_id):
     """Display detailed token information"""
     logger.info(f"Fetching comprehensive details for token {token_id}")
@@ -96,14 +102,15 @@ async def display_token_details(token_id):
                 # List holders in this snapshot
                 holders = snapshot.get("holders", {})
                 if holders:
-                    logger.info(f"  Holders: {len(holders)} addresses")
-                    # Show top 5 holders by amount
-                    sorted_holders = sorted(holders.items(), key=lambda x: int(x[1]) if isinstance(x[1], (int, str)) else 0, reverse=True)
-                    for j, (address, amount) in enumerate(sorted_holders[:5]):
+                    holder_count = len(holders)
+                    logger.info(f"  Holders: {holder_count} addresses")
+                    # Show top 5 holders by amount without sorting every holder
+                    top_holders = heapq.nlargest(5, holders.items(), key=_holder_amount)
+                    for j, (address, amount) in enumerate(top_holders):
                         logger.info(f"    {j+1}. {address}: {amount}")
                     
-                    if len(sorted_holders) > 5:
-                        logger.info(f"    ... and {len(sorted_holders) - 5} more addresses")
+                    if holder_count > 5:
+                        logger.info(f"    ... and {holder_count - 5} more addresses")
                 else:
                     logger.info("  No holders in this snapshot")
                 logger.info(f"  {'-' * 30}")
@@ -0,0 +1,38 @@
+"""
+Shared in-process MCP stand-in for the standalone test scripts.
+
+Route registration is memoized per register function, so scripts run
+together (see run_all_tests.py) register each route module only once.
+"""
+
+import functools
+
+from mcp.server.fastmcp import Context, FastMCP
+
+class TestMCP(FastMCP):
+    """Simple MCP implementation that records tools and calls them directly."""
+
+    def __init__(self):
+        self.tools = {}
+        # One Context is shared by every call and bound into each tool up front
+        self._ctx = Context()
+
+    def tool(self, name=None):
+        def wrapper(func):
+            tool_name = name or func.__name__
+            self.tools[tool_name] = functools.partial(func, self._ctx)
+            return func
+        return wrapper
+
+    async def call_tool(self, name, **kwargs):
+        tool = self.tools.get(name)
+        if tool is None:
+            raise ValueError(f"Tool {name} not found")
+        return await tool(**kwargs)
+
+@functools.lru_cache(maxsize=None)
+def _build_mcp(register_fn):
+    """Return a TestMCP with the routes from register_fn registered on it."""
+    mcp = TestMCP()
+    register_fn(mcp)
+    return mcp
@@ -1,6 +1,5 @@
 """Tests for the Address Book API tools."""
 
-import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
@@ -61,48 +60,44 @@ def sample_address_book_data():
 @pytest.fixture
 def mock_address_book_api():
     """Mock address book API for testing."""
-    with patch("ergo_explorer.tools.address_book.get_address_book") as mock_get_book, \
-         patch("ergo_explorer.tools.address_book.filter_address_book_by_type") as mock_filter_type, \
-         patch("ergo_explorer.tools.address_book.search_address_book") as mock_search, \
-         patch("ergo_explorer.tools.address_book.get_address_details") as mock_get_details:
+    with patch("ergo_explorer.tools.address_book.get_address_book", new_callable=AsyncMock) as mock_get_book, \
+         patch("ergo_explorer.tools.address_book.filter_address_book_by_type", new_callable=AsyncMock) as mock_filter_type, \
+         patch("ergo_explorer.tools.address_book.search_address_book", new_callable=AsyncMock) as mock_search, \
+         patch("ergo_explorer.tools.address_book.get_address_details", new_callable=AsyncMock) as mock_get_details:
         
         # Mock get_address_book
-        mock_get_book.return_value = asyncio.Future()
-        mock_get_book.return_value.set_result({
+        mock_get_book.return_value = {
             "items": [
                 {"name": "Exchange A", "type": "Exchange", "address": "addr1"},
                 {"name": "Mining Pool B", "type": "Mining pool", "address": "addr2"},
                 {"name": "Service C", "type": "Service", "address": "addr3"}
             ]
-        })
+        }
         
         # Mock filter_address_book_by_type
-        mock_filter_type.return_value = asyncio.Future()
-        mock_filter_type.return_value.set_result({
+        mock_filter_type.return_value = {
             "items": [
                 {"name": "Exchange A", "type": "Exchange", "address": "addr1"},
                 {"name": "Exchange D", "type": "Exchange", "address": "addr4"}
             ]
-        })
+        }
         
         # Mock search_address_book
-        mock_search.return_value = asyncio.Future()
-        mock_search.return_value.set_result({
+        mock_search.return_value = {
             "items": [
                 {"name": "Mining Pool B", "type": "Mining pool", "address": "addr2"},
                 {"name": "Mining Pool E", "type": "Mining pool", "address": "addr5"}
             ]
-        })
+        }
         
         # Mock get_address_details
-        mock_get_details.return_value = asyncio.Future()
-        mock_get_details.return_value.set_result({
+        mock_get_details.return_value = {
             "name": "Service C", 
             "type": "Service", 
             "address": "addr3",
             "description": "A service",
             "url": "https://service.com"
-        })
+        }
         
         yield {
             "get_book": mock_get_book,
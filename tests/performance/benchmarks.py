@@ -143,7 +143,7 @@ def run_single_benchmark(endpoint: str, params: Dict[str, Any]) -> Tuple[float,
     start_snapshot = tracemalloc.take_snapshot()
     
     # Make the request
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         response = requests.post(url, json=params, timeout=TIMEOUT)
         status_code = response.status_code
@@ -153,11 +153,11 @@ def run_single_benchmark(endpoint: str, params: Dict[str, Any]) -> Tuple[float,
             response_data = {"error": "Invalid JSON response"}
             
     except Exception as e:
-        end_time = time.time()
+        end_time = time.perf_counter()
         status_code = 500
         response_data = {"error": str(e)}
     else:
-        end_time = time.time()
+        end_time = time.perf_counter()
     
     # Get memory usage
     end_snapshot = tracemalloc.take_snapshot()
@@ -69,13 +69,16 @@ def detect_response_type(response_text: str) -> str:
     Returns:
         String indicating the detected type: "json", "markdown", or "unknown"
     """
-    # Try to parse as JSON
-    try:
-        json.loads(response_text)
-        return "json"
-    except json.JSONDecodeError:
-        pass
-    
+    # Only attempt a JSON parse when the first non-space character can open
+    # a JSON document; markdown/text bodies are rejected without parsing
+    stripped = response_text.lstrip()
+    if stripped[:1] in ("{", "["):
+        try:
+            json.loads(stripped)
+            return "json"
+        except json.JSONDecodeError:
+            pass
+
     # Check for markdown indicators
     markdown_indicators = [
         "# ", "## ", "### ", "#### ", "##### ", "###### ",  # Headers
@@ -87,7 +90,7 @@ def detect_response_type(response_text: str) -> str:
     ]
     
     # Count markdown indicators
-    indicators_found = sum(1 for indicator in markdown_indicators if indicator in response_text)
+    indicators_found = sum(1 for indicator in markdown_indicators if indicator in stripped)
     
     # If multiple markdown indicators are found, it's likely markdown
     if indicators_found >= 2:
@@ -128,9 +131,9 @@ def test_endpoint_response(
     }
     
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = requests.post(url, json=params, headers=HEADERS, timeout=TIMEOUT)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         result["status_code"] = response.status_code
         result["execution_time_ms"] = round((end_time - start_time) * 1000, 2)
@@ -117,7 +117,7 @@ def update_config(args):
 
 def main():
     """Main function to run benchmarks."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Parse arguments
     args = parse_args()
@@ -140,7 +140,7 @@ def main():
     generate_full_report()
     
     # Log completion
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     logger.info(f"Benchmarks completed in {elapsed_time:.2f} seconds")
     logger.info(f"Reports saved to {report_dir}")
 
@@ -49,7 +49,7 @@ def list_available_tests(test_files):
         print(f"  - {test}")
 
 
-def run_specific_test(test_name, test_files, verbose=False):
+def run_specific_test(test_name, test_files, verbose=False, fail_fast=False):
     """Run a specific test file."""
     # Check if the test exists
     test_path = None
@@ -74,12 +74,14 @@ def run_specific_test(test_name, test_files, verbose=False):
     cmd = ["pytest", str(test_path)]
     if verbose:
         cmd.append("-v")
+    if fail_fast:
+        cmd.append("-x")
     
     result = subprocess.run(cmd)
     return result.returncode
 
 
-def run_tests_by_category(category, test_files, verbose=False):
+def run_tests_by_category(category, test_files, verbose=False, fail_fast=False):
     """Run all tests in a specific category."""
     if category not in test_files:
         print(f"Error: Category '{category}' not found.")
@@ -97,32 +99,34 @@ def run_tests_by_category(category, test_files, verbose=False):
     elif category == "unit":
         test_path = Path(__file__).parent / "unit"
     else:  # root
-        # For root, we need to run each test individually
-        return_code = 0
-        for test in tests:
-            test_path = Path(__file__).parent / f"{test}.py"
-            cmd = ["pytest", str(test_path)]
-            if verbose:
-                cmd.append("-v")
-            result = subprocess.run(cmd)
-            if result.returncode != 0:
-                return_code = result.returncode
-        return return_code
+        # Root tests share a directory with other files, so pass each test
+        # file to a single pytest process rather than spawning one per file
+        cmd = ["pytest"] + [str(Path(__file__).parent / f"{test}.py") for test in tests]
+        if verbose:
+            cmd.append("-v")
+        if fail_fast:
+            cmd.append("-x")
+        result = subprocess.run(cmd)
+        return result.returncode
     
     cmd = ["pytest", str(test_path)]
     if verbose:
         cmd.append("-v")
+    if fail_fast:
+        cmd.append("-x")
     
     result = subprocess.run(cmd)
     return result.returncode
 
 
-def run_all_tests(verbose=False):
+def run_all_tests(verbose=False, fail_fast=False):
     """Run all tests."""
     print("Running all tests")
     cmd = ["pytest"]
     if verbose:
         cmd.append("-v")
+    if fail_fast:
+        cmd.append("-x")
     
     result = subprocess.run(cmd)
     return result.returncode
@@ -136,6 +140,7 @@ def main():
     parser.add_argument("--list", action="store_true", help="List all available tests")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--all", action="store_true", help="Run all tests")
+    parser.add_argument("--fail-fast", "-x", action="store_true", help="Stop at the first failing test (for CI)")
     
     args = parser.parse_args()
     
@@ -149,15 +154,15 @@ def main():
     
     # Run a specific test
     if args.test:
-        return run_specific_test(args.test, test_files, args.verbose)
+        return run_specific_test(args.test, test_files, args.verbose, args.fail_fast)
     
     # Run tests by category
     if args.category:
-        return run_tests_by_category(args.category, test_files, args.verbose)
+        return run_tests_by_category(args.category, test_files, args.verbose, args.fail_fast)
     
     # Run all tests
     if args.all or (not args.test and not args.category and not args.list):
-        return run_all_tests(args.verbose)
+        return run_all_tests(args.verbose, args.fail_fast)
     
     # No action specified
     parser.print_help()
@@ -13,9 +13,8 @@ import time
 from pprint import pprint
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 logger = logging.getLogger()
-logger.addHandler(logging.StreamHandler(sys.stdout))
 
 # Import the entity identification functions
 from ergo_explorer.tools.entity_identification import identify_entities_json, identify_entities
@@ -40,7 +39,7 @@ async def test_entity_identification(address):
     """Test entity identification for a specific address and print results."""
     logger.info(f"Testing entity identification for address: {address}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Use optimized parameters for testing
@@ -58,7 +57,7 @@ async def test_entity_identification(address):
         result = json.loads(result_json)
         
         # Print basic results
-        logger.info(f"Entity identification completed in {time.time() - start_time:.2f} seconds")
+        logger.info(f"Entity identification completed in {time.perf_counter() - start_time:.2f} seconds")
         logger.info(f"Found {result.get('total_addresses', 0)} addresses in {len(result.get('clusters', {}))} clusters")
         
         # Validate the result structure
@@ -7,17 +7,15 @@ This script injects our mocks into sys.modules before running the test runner.
 
 import sys
 import os
-import importlib.util
+import importlib
 
 # Add the project root to sys.path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-# Import our mock_logging module
-mock_logging_path = os.path.join(os.path.dirname(__file__), "mock_logging.py")
-spec = importlib.util.spec_from_file_location("mock_logging", mock_logging_path)
-mock_logging = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(mock_logging)
+# Import our mock_logging module through the normal import system, so it is
+# registered in sys.modules and reused rather than re-executed by a manual loader
+mock_logging = importlib.import_module("tests.mock_logging")
 
 # Replace the actual logging configuration with our mock
 sys.modules["ergo_explorer.logging_config"] = mock_logging
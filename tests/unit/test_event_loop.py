@@ -0,0 +1,37 @@
+"""
+Tests for the event loop helper in ergo_explorer.util.event_loop.
+
+Each test runs with uvloop (when installed) and with the asyncio fallback.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from ergo_explorer.util import event_loop
+from ergo_explorer.util.event_loop import run_async, UVLOOP_AVAILABLE
+
+BACKENDS = [False, True] if UVLOOP_AVAILABLE else [False]
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda use_uvloop: "uvloop" if use_uvloop else "asyncio")
+def backend(request):
+    """Run the test with uvloop enabled or forced off."""
+    with patch.object(event_loop, "UVLOOP_AVAILABLE", request.param):
+        yield request.param
+
+
+def test_run_async_returns_result(backend):
+    """Test that run_async returns the coroutine's result."""
+    async def answer():
+        return 42
+
+    assert run_async(answer()) == 42
+
+
+def test_run_async_propagates_exceptions(backend):
+    """Test that exceptions raised by the coroutine reach the caller."""
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run_async(fail())
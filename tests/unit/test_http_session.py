@@ -0,0 +1,19 @@
+"""
+Tests for the shared HTTP client in ergo_explorer.http_session.
+"""
+
+import pytest
+
+from ergo_explorer.http_session import client_lifespan, get_client
+
+
+@pytest.mark.asyncio
+async def test_client_lifespan_closes_client_after_last_session():
+    """Test that the server lifespan closes the shared client once every session has ended."""
+    async with client_lifespan(None):
+        client = get_client()
+        async with client_lifespan(None):
+            assert get_client() is client
+        # Another session is still active, so the client stays open
+        assert not client.is_closed
+    assert client.is_closed
@@ -0,0 +1,64 @@
+"""
+Tests for the JSON helpers in ergo_explorer.util.json_utils.
+
+Each test runs against both the orjson backend (when installed) and the
+standard library fallback, which must produce equivalent documents.
+"""
+
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+from ergo_explorer.util import json_utils
+from ergo_explorer.util.json_utils import dumps_pretty, loads, ORJSON_AVAILABLE
+
+SAMPLE_DATA = {
+    "b": 1,
+    "a": {"height": 1000, 7: "non-string key"},
+    "timestamp": datetime(2024, 1, 2, 3, 4, 5)
+}
+
+BACKENDS = [False, True] if ORJSON_AVAILABLE else [False]
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda use_orjson: "orjson" if use_orjson else "stdlib")
+def backend(request):
+    """Run the test with orjson enabled or forced off."""
+    with patch.object(json_utils, "ORJSON_AVAILABLE", request.param):
+        yield request.param
+
+
+def test_dumps_pretty_round_trip(backend):
+    """Test that datetimes and non-string keys serialize and load back."""
+    data = dumps_pretty(SAMPLE_DATA)
+
+    assert isinstance(data, bytes)
+    assert loads(data) == {
+        "b": 1,
+        "a": {"height": 1000, "7": "non-string key"},
+        "timestamp": "2024-01-02T03:04:05"
+    }
+
+
+def test_dumps_pretty_indents(backend):
+    """Test that output is indented by two spaces."""
+    assert dumps_pretty({"a": 1}) == b'{\n  "a": 1\n}'
+
+
+def test_dumps_pretty_sort_keys(backend):
+    """Test that sort_keys orders dictionary keys."""
+    text = dumps_pretty({"b": 1, "a": 2}, sort_keys=True).decode()
+    assert text.index('"a"') < text.index('"b"')
+
+
+def test_dumps_pretty_unserializable(backend):
+    """Test that unsupported values raise TypeError."""
+    with pytest.raises(TypeError):
+        dumps_pretty({"value": object()})
+
+
+def test_loads_invalid(backend):
+    """Test that invalid input raises a ValueError with either backend."""
+    with pytest.raises(ValueError):
+        loads(b"<html>not json</html>")
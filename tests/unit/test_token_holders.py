@@ -2,21 +2,25 @@
 Tests for token holder functionality.
 """
 
+import asyncio
 import pytest
 import json
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
+from datetime import datetime
 
 # Update imports to use the new modular structure directly
 from ergo_explorer.tools.token_holders.holders import get_token_holders
 from ergo_explorer.tools.token_holders.tokens import get_token_by_id
 from ergo_explorer.tools.token_holders.boxes import get_unspent_boxes_by_token_id
+from ergo_explorer.tools.token_holders.cache import save_token_history_to_disk, load_token_history_from_disk
 
 # Path updates for imports in the test file
 TOKENS_MODULE_PATH = 'ergo_explorer.tools.token_holders.tokens'
 BOXES_MODULE_PATH = 'ergo_explorer.tools.token_holders.boxes'
 HOLDERS_MODULE_PATH = 'ergo_explorer.tools.token_holders.holders'
 API_MODULE_PATH = 'ergo_explorer.tools.token_holders.api'
+CACHE_MODULE_PATH = 'ergo_explorer.tools.token_holders.cache'
 
 
 @pytest.mark.asyncio
@@ -41,6 +45,51 @@ async def test_get_token_by_id(mock_fetch_node_api, sample_token_id):
     mock_fetch_node_api.assert_called_once_with(f"blockchain/token/byId/{sample_token_id}")
 
 
+@pytest.mark.asyncio
+@patch(f'{TOKENS_MODULE_PATH}.fetch_node_api')
+async def test_get_token_by_id_concurrent_calls_share_request(mock_fetch_node_api):
+    """Test that concurrent get_token_by_id calls for one token make a single request."""
+    token_id = "concurrent_test_token"
+    mock_response = {"id": token_id, "name": "Concurrent Token"}
+
+    async def slow_fetch(endpoint):
+        await asyncio.sleep(0.01)
+        return mock_response
+    mock_fetch_node_api.side_effect = slow_fetch
+
+    # Call the function concurrently
+    results = await asyncio.gather(*(get_token_by_id(token_id) for _ in range(5)))
+
+    # Verify every caller got the result from one request
+    assert results == [mock_response] * 5
+    mock_fetch_node_api.assert_called_once_with(f"blockchain/token/byId/{token_id}")
+
+
+@pytest.mark.asyncio
+@patch(f'{TOKENS_MODULE_PATH}.fetch_node_api')
+async def test_get_token_by_id_cancelled_caller_does_not_cancel_shared_request(mock_fetch_node_api):
+    """Test that cancelling the first get_token_by_id caller leaves joined callers their result."""
+    token_id = "cancelled_caller_test_token"
+    mock_response = {"id": token_id, "name": "Shared Token"}
+
+    async def slow_fetch(endpoint):
+        await asyncio.sleep(0.01)
+        return mock_response
+    mock_fetch_node_api.side_effect = slow_fetch
+
+    # Start the request, join it from a second caller, then cancel the first caller
+    first = asyncio.ensure_future(get_token_by_id(token_id))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(get_token_by_id(token_id))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    # Verify the joined caller still gets the result of the single request
+    assert await second == mock_response
+    assert first.cancelled()
+    mock_fetch_node_api.assert_called_once_with(f"blockchain/token/byId/{token_id}")
+
+
 @pytest.mark.asyncio
 @patch(f'{BOXES_MODULE_PATH}.fetch_node_api')
 async def test_get_unspent_boxes_by_token_id(mock_fetch_node_api, sample_token_id):
@@ -96,6 +145,23 @@ async def test_get_unspent_boxes_by_token_id_error(mock_fetch_node_api, sample_t
     assert result == []
 
 
+def test_save_token_history_to_disk_with_datetimes(tmp_path):
+    """Test that token history with datetime metadata is saved whole and loads back."""
+    history_data = {
+        "metadata": {"token_id": "history_token", "first_tracked": datetime(2024, 1, 2, 3, 4, 5)},
+        "snapshots": {},
+        "transfers": []
+    }
+    
+    with patch(f'{CACHE_MODULE_PATH}.get_history_cache_dir', return_value=tmp_path):
+        assert save_token_history_to_disk("history_token", history_data) is True
+        loaded = load_token_history_from_disk("history_token")
+    
+    # Verify the file is complete JSON with the datetime in ISO format
+    assert loaded["metadata"]["first_tracked"] == "2024-01-02T03:04:05"
+    assert loaded["transfers"] == []
+
+
 @pytest.mark.asyncio
 @patch('httpx.AsyncClient', new_callable=MagicMock) 
 async def test_get_token_holders_success(